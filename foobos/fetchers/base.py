@@ -3,22 +3,37 @@ Base fetcher class with common functionality.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Optional, Tuple
 import logging
 
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..models import Concert
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional - decodes large API payloads several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Keep-alive connections per session; enough for venue loops and paging to
+# reuse one TLS connection per host
+HTTP_POOL_SIZE = 16
+
 
 class BaseFetcher(ABC):
     """Abstract base class for concert data fetchers."""
 
     def __init__(self):
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update({
             "User-Agent": "foobos/1.0 (Boston punk concert aggregator)"
         })
@@ -62,6 +77,45 @@ class BaseFetcher(ABC):
         response.raise_for_status()
         return response
 
+    def _make_conditional_request(self, url: str, validators: Optional[dict] = None,
+                                  params: dict = None) -> Tuple[Optional[requests.Response], dict]:
+        """
+        Make a conditional GET using validators from a previous response.
+
+        Sends If-None-Match / If-Modified-Since built from validators, so an
+        unchanged resource costs a body-less 304.
+
+        Args:
+            url: URL to request
+            validators: Validators returned by a previous call, if any
+            params: Query parameters
+
+        Returns:
+            (response, validators) - response is None when the server reports
+            the resource unchanged; validators should be stored for the next call
+        """
+        headers = {}
+        if validators:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self._make_request(url, params=params, headers=headers)
+        if response.status_code == 304:
+            return None, validators
+
+        return response, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+    def _decode_json(self, response: requests.Response) -> Any:
+        """Decode a JSON response body, with orjson when available."""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content)
+        return response.json()
+
     def _log_fetch_start(self):
         """Log fetch operation start."""
         logger.info(f"[{self.source_name}] Starting fetch...")
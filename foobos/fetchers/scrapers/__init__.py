@@ -1,4 +1,5 @@
 from .base import BaseScraper
+from ._playwright_pool import shutdown_browser
 from .safe_in_a_crowd import SafeInACrowdScraper
 from .do617 import Do617Scraper
 from .middle_east import MiddleEastScraper
@@ -27,6 +28,7 @@ from .hobgoblin import HobgoblinScraper
 
 __all__ = [
     "BaseScraper",
+    "shutdown_browser",
     "SafeInACrowdScraper",
     "Do617Scraper",
     "MiddleEastScraper",
@@ -0,0 +1,65 @@
+"""
+Shared headless Chromium for the Playwright-based scrapers.
+
+The driver and browser are started on first use, so scrapers that run one
+after another pay the browser cold start once. Scrapers should open their own
+context per fetch and close it when done.
+
+Playwright's sync API is bound to the thread that started it, so the shared
+browser must only be used from that thread (the orchestrator's main thread).
+While the driver is running, that thread also counts as being inside an
+asyncio loop: a second `sync_playwright()` or an `asyncio.run()` there fails.
+Every sync Playwright scraper must therefore go through get_browser(), and
+the orchestrator calls shutdown_browser() once the Playwright scrapers are
+done (it is also registered at exit as a backstop).
+"""
+
+import atexit
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Process-wide Playwright driver and browser
+_PLAYWRIGHT = None
+_BROWSER = None
+_SHUTDOWN_REGISTERED = False
+
+
+def get_browser():
+    """Return the shared headless Chromium, launching it if needed."""
+    global _PLAYWRIGHT, _BROWSER, _SHUTDOWN_REGISTERED
+    if _BROWSER is None or not _BROWSER.is_connected():
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = sync_playwright().start()
+            if not _SHUTDOWN_REGISTERED:
+                atexit.register(shutdown_browser)
+                _SHUTDOWN_REGISTERED = True
+        logger.debug("Launching shared headless Chromium")
+        _BROWSER = _PLAYWRIGHT.chromium.launch(headless=True)
+    return _BROWSER
+
+
+def shutdown_browser():
+    """Close the shared browser and stop the Playwright driver.
+
+    Safe to call more than once; a later get_browser() starts a fresh driver.
+    """
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is not None:
+        try:
+            _BROWSER.close()
+        except Exception:
+            pass
+        _BROWSER = None
+    if _PLAYWRIGHT is not None:
+        try:
+            _PLAYWRIGHT.stop()
+        except Exception:
+            pass
+        _PLAYWRIGHT = None
@@ -11,8 +11,9 @@ their own websites which often have server-rendered calendars:
 - Brighton Music Hall
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict, Tuple
 import logging
 import re
 import json
@@ -25,6 +26,13 @@ from ...utils import get_cached, save_cache, parse_date
 
 logger = logging.getLogger(__name__)
 
+# selectolax is optional - much faster than BeautifulSoup for the row scan
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 
 # Non-music event keywords to filter out (for multi-purpose venues)
 NON_MUSIC_KEYWORDS = [
@@ -62,6 +70,10 @@ MUSIC_KEYWORDS = [
 ]
 
 
+# Berklee pages fetched in parallel ahead of the parser
+BERKLEE_PAGE_PREFETCH = 4
+
+
 # Venue configurations - using venue websites
 # Note: Royale and Sinclair removed - covered by BoweryBostonScraper
 BOSTON_VENUES = {
@@ -120,10 +132,10 @@ class AXSVenuesScraper(BaseScraper):
         parser_type = venue_config.get("parser", "berklee")
 
         try:
-            soup = self._get_soup(venue_config["url"])
+            html = self._get_html(venue_config["url"])
 
             if parser_type == "berklee":
-                concerts = self._parse_berklee(soup, venue_id, venue_config)
+                concerts = self._parse_berklee(html, venue_id, venue_config)
 
         except Exception as e:
             logger.debug(f"Error scraping {venue_config['name']}: {e}")
@@ -386,7 +398,7 @@ class AXSVenuesScraper(BaseScraper):
 
         return concerts
 
-    def _parse_berklee(self, soup: BeautifulSoup, venue_id: str, venue_config: Dict) -> List[Concert]:
+    def _parse_berklee(self, html: str, venue_id: str, venue_config: Dict) -> List[Concert]:
         """Parse events from Berklee's Drupal-based events page.
 
         Berklee uses a standard Drupal views structure with:
@@ -402,24 +414,15 @@ class AXSVenuesScraper(BaseScraper):
         base_url = venue_config["url"]
         max_pages = 20  # Safety limit
 
-        for page_num in range(max_pages):
-            # Fetch page (page 0 is the initial soup we already have)
-            if page_num == 0:
-                page_soup = soup
-            else:
-                page_url = f"{base_url}?page={page_num}"
-                try:
-                    page_soup = self._get_soup(page_url)
-                except Exception as e:
-                    logger.debug(f"Error fetching Berklee page {page_num}: {e}")
-                    break
+        for page_num, page_html in self._iter_berklee_pages(html, base_url, max_pages):
+            if page_html is None:
+                break
 
-            view = page_soup.find(class_="view-events")
-            if not view:
+            rows = self._extract_berklee_rows(page_html)
+            if rows is None:
                 logger.debug("No view-events container found on Berklee page")
                 break
 
-            rows = view.find_all(class_="views-row")
             if not rows:
                 # No more events on this page
                 break
@@ -435,25 +438,85 @@ class AXSVenuesScraper(BaseScraper):
 
         return concerts
 
+    def _iter_berklee_pages(self, html: str, base_url: str,
+                            max_pages: int) -> Iterator[Tuple[int, Optional[str]]]:
+        """Yield (page_num, html) in page order, fetching later pages in parallel batches.
+
+        Page 0 is the initial HTML we already have. A page that fails to load
+        is yielded as None. Nothing is fetched until the caller asks for page 1.
+        """
+        yield 0, html
+
+        with ThreadPoolExecutor(max_workers=BERKLEE_PAGE_PREFETCH) as pool:
+            for start in range(1, max_pages, BERKLEE_PAGE_PREFETCH):
+                batch = range(start, min(start + BERKLEE_PAGE_PREFETCH, max_pages))
+                futures = [pool.submit(self._get_html, f"{base_url}?page={n}") for n in batch]
+                for page_num, future in zip(batch, futures):
+                    try:
+                        page_html = future.result()
+                    except Exception as e:
+                        logger.debug(f"Error fetching Berklee page {page_num}: {e}")
+                        page_html = None
+                    yield page_num, page_html
+
+    def _extract_berklee_rows(self, html: str) -> Optional[List[Tuple[Optional[str], ...]]]:
+        """Return raw (title, venue, datetime, event href) for each views-row.
+
+        Missing elements come back as None. Returns None when the page has no
+        view-events container at all.
+        """
+        rows = []
+
+        if SELECTOLAX_AVAILABLE:
+            view = LexborHTMLParser(html).css_first('.view-events')
+            if view is None:
+                return None
+            for row in view.css('.views-row'):
+                title_node = row.css_first('.title')
+                venue_node = row.css_first('.field--name-field-event-venue-title')
+                time_node = row.css_first('time')
+                link_node = row.css_first('a[href*="/events/"]')
+                rows.append((
+                    title_node.text() if title_node is not None else None,
+                    venue_node.text() if venue_node is not None else None,
+                    time_node.attributes.get('datetime') if time_node is not None else None,
+                    link_node.attributes.get('href') if link_node is not None else None,
+                ))
+            return rows
+
+        view = self._make_soup(html).find(class_="view-events")
+        if not view:
+            return None
+        for row in view.find_all(class_="views-row"):
+            title_div = row.find(class_="title")
+            venue_field = row.find(class_="field--name-field-event-venue-title")
+            time_elem = row.find("time")
+            event_link = row.find("a", href=lambda x: x and "/events/" in x)
+            rows.append((
+                title_div.get_text() if title_div else None,
+                venue_field.get_text() if venue_field else None,
+                time_elem.get("datetime") if time_elem else None,
+                event_link.get("href") if event_link else None,
+            ))
+        return rows
+
     def _parse_berklee_rows(self, rows, venue_id: str, venue_config: Dict, use_page_venue: bool) -> List[Concert]:
-        """Parse event rows from a single Berklee page."""
+        """Parse raw event rows (see _extract_berklee_rows) from a single Berklee page."""
         concerts = []
 
-        for row in rows:
+        for raw_title, raw_venue, datetime_str, href in rows:
             try:
                 # Get event title
-                title_div = row.find(class_="title")
-                if not title_div:
+                if raw_title is None:
                     continue
-                event_name = self._clean_text(title_div.get_text())
+                event_name = self._clean_text(raw_title)
                 if not event_name or len(event_name) < 3:
                     continue
 
                 # Get venue from page
-                venue_field = row.find(class_="field--name-field-event-venue-title")
                 event_venue = ""
-                if venue_field:
-                    event_venue = self._clean_text(venue_field.get_text().replace("Venue Title", ""))
+                if raw_venue is not None:
+                    event_venue = self._clean_text(raw_venue.replace("Venue Title", ""))
 
                 # Determine venue name and ID
                 if use_page_venue and event_venue:
@@ -465,11 +528,6 @@ class AXSVenuesScraper(BaseScraper):
                     actual_venue_id = venue_id
 
                 # Get date/time
-                time_elem = row.find("time")
-                if not time_elem:
-                    continue
-
-                datetime_str = time_elem.get("datetime", "")
                 if not datetime_str:
                     continue
 
@@ -503,9 +561,7 @@ class AXSVenuesScraper(BaseScraper):
 
                 # Get ticket link if available
                 source_url = venue_config["url"]
-                event_link = row.find("a", href=lambda x: x and "/events/" in x)
-                if event_link:
-                    href = event_link.get("href", "")
+                if href:
                     if href.startswith("/"):
                         source_url = f"https://www.berklee.edu{href}"
                     elif href.startswith("http"):
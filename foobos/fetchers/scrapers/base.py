@@ -3,17 +3,25 @@ Base scraper class for web scraping concert data.
 """
 
 from abc import abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 import logging
 import re
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..base import BaseFetcher
 from ...models import Concert
 
 logger = logging.getLogger(__name__)
 
+# Playwright resource types that never affect the HTML we parse
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Band separators normalized to commas by _split_bands, matched in one pass
+BAND_SEPARATOR_RE = re.compile(r' (?:w/|with|and|\+|/|\|) ')
+
 
 class BaseScraper(BaseFetcher):
     """Abstract base class for web scrapers."""
@@ -24,26 +32,77 @@ class BaseScraper(BaseFetcher):
         """Return the URL to scrape."""
         pass
 
-    def _get_soup(self, url: str = None) -> BeautifulSoup:
+    def _get_soup(self, url: str = None, parse_only: SoupStrainer = None) -> BeautifulSoup:
         """
         Fetch URL and return BeautifulSoup object.
 
         Args:
             url: URL to fetch (defaults to self.url)
+            parse_only: Optional SoupStrainer restricting which elements are
+                built into the tree (skips unrelated page chrome)
 
         Returns:
             BeautifulSoup object
         """
+        return self._make_soup(self._get_html(url), parse_only=parse_only)
+
+    def _get_html(self, url: str = None) -> str:
+        """
+        Fetch URL and return the raw response body.
+
+        Args:
+            url: URL to fetch (defaults to self.url)
+
+        Returns:
+            Response text
+        """
         target_url = url or self.url
         response = self._make_request(target_url)
-        return BeautifulSoup(response.text, "lxml")
+        return response.text
+
+    def _get_html_if_modified(self, url: str, validators: Optional[dict] = None) -> Tuple[Optional[str], dict]:
+        """
+        Fetch URL with a conditional GET.
+
+        See BaseFetcher._make_conditional_request; an unchanged page costs a
+        body-less 304.
+
+        Args:
+            url: URL to fetch
+            validators: Validators returned by a previous call, if any
+
+        Returns:
+            (text, validators) - text is None when the server reports the page
+            unchanged; validators should be stored for the next call
+        """
+        response, validators = self._make_conditional_request(url, validators)
+        return (response.text if response is not None else None), validators
+
+    def _make_soup(self, html: str, parse_only: SoupStrainer = None) -> BeautifulSoup:
+        """Parse already-fetched HTML into a BeautifulSoup object."""
+        return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+    def _block_heavy_resources(self, page):
+        """
+        Abort image/font/CSS/media requests on a Playwright page.
+
+        Scrapers only read the rendered DOM, so these downloads just slow down
+        page loads. Returns the result of page.route(), which async API
+        callers must await.
+        """
+        def handle(route):
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+                return route.abort()
+            return route.continue_()
+
+        return page.route("**/*", handle)
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
         if not text:
             return ""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text.strip()
 
     def _parse_price(self, price_str: str) -> tuple:
@@ -157,15 +216,16 @@ class BaseScraper(BaseFetcher):
             return []
 
         # Normalize separators
-        bands_str = bands_str.replace(" w/ ", ", ")
-        bands_str = bands_str.replace(" with ", ", ")
-        bands_str = bands_str.replace(" and ", ", ")
-        bands_str = bands_str.replace(" + ", ", ")
-        bands_str = bands_str.replace(" / ", ", ")
-        bands_str = bands_str.replace(" | ", ", ")
+        bands_str = BAND_SEPARATOR_RE.sub(", ", bands_str)
+
+        # Fast path: a single act needs no splitting
+        if "," not in bands_str:
+            band = self._clean_text(bands_str)
+            return [band] if len(band) > 1 else []
 
         # Split and clean
-        bands = [self._clean_text(b) for b in bands_str.split(",")]
+        clean = self._clean_text
+        bands = [clean(b) for b in bands_str.split(",")]
         bands = [b for b in bands if b and len(b) > 1]
 
         return bands
@@ -9,7 +9,6 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 import logging
 import re
-import requests
 
 from .base import BaseScraper
 from ...models import Concert
@@ -44,7 +43,7 @@ class BeehiveScraper(BaseScraper):
 
         concerts = []
         try:
-            response = requests.get(BEEHIVE_ICAL_URL, timeout=30)
+            response = self.session.get(BEEHIVE_ICAL_URL, timeout=30)
             response.raise_for_status()
 
             events = self._parse_ical(response.text)
@@ -8,6 +8,8 @@ from typing import List, Optional
 import logging
 import re
 
+from bs4 import SoupStrainer
+
 from .base import BaseScraper
 from ...models import Concert
 from ...config import WEEKS_AHEAD
@@ -20,6 +22,11 @@ logger = logging.getLogger(__name__)
 # 12057: BSO, 12058: Tanglewood, 12059: Boston Pops, 12060: Symphony Hall
 BSO_EVENTS_URL = "https://www.bso.org/events?view=byevent&brands=12057,12058,12059,12060"
 
+# Only build tree nodes for event articles; header, nav and footer are skipped.
+# The strainer sees the raw class attribute ("event-tease tanglewood"), so
+# match the class as a whole word rather than the full attribute value.
+EVENT_STRAINER = SoupStrainer('article', class_=re.compile(r'(?:^|\s)event-tease(?:\s|$)'))
+
 
 class BSOScraper(BaseScraper):
     """Scrape events from BSO (Boston Symphony Orchestra) venues."""
@@ -45,14 +52,18 @@ class BSOScraper(BaseScraper):
         concerts = []
 
         try:
-            soup = self._get_soup(self.url)
+            soup = self._get_soup(self.url, parse_only=EVENT_STRAINER)
 
             # Find all event articles
             events = soup.select('article.event-tease')
 
+            # Only include future events within configured lookahead
+            now = datetime.now()
+            max_date = now + timedelta(weeks=WEEKS_AHEAD)
+
             for event in events:
                 try:
-                    event_concerts = self._parse_event(event)
+                    event_concerts = self._parse_event(event, now, max_date)
                     concerts.extend(event_concerts)
                 except Exception as e:
                     logger.debug(f"Error parsing BSO event: {e}")
@@ -68,7 +79,7 @@ class BSOScraper(BaseScraper):
 
         return concerts
 
-    def _parse_event(self, event_elem) -> List[Concert]:
+    def _parse_event(self, event_elem, now: datetime, max_date: datetime) -> List[Concert]:
         """Parse a BSO event element into Concert objects.
 
         Each event can have multiple performances (dates), so this returns a list.
@@ -95,13 +106,11 @@ class BSOScraper(BaseScraper):
 
         for perf in performances:
             try:
-                date = self._extract_performance_date(perf)
+                date = self._extract_performance_date(perf, now.year)
                 if not date:
                     continue
 
-                # Only include future events within configured lookahead
-                now = datetime.now()
-                if date < now or date > now + timedelta(weeks=WEEKS_AHEAD):
+                if date < now or date > max_date:
                     continue
 
                 time_str = self._extract_performance_time(perf)
@@ -147,8 +156,8 @@ class BSOScraper(BaseScraper):
         else:
             return ('symphonyhall', 'Symphony Hall', 'Boston')
 
-    def _extract_performance_date(self, perf_elem) -> Optional[datetime]:
-        """Extract date from performance element."""
+    def _extract_performance_date(self, perf_elem, current_year: int) -> Optional[datetime]:
+        """Extract date from performance element, defaulting to current_year."""
         date_elem = perf_elem.select_one('.event-tease__performance-date')
         year_elem = perf_elem.select_one('.event-tease__performance-year')
 
@@ -156,7 +165,7 @@ class BSOScraper(BaseScraper):
             return None
 
         date_text = self._clean_text(date_elem.get_text())  # e.g., "Jan 19"
-        year_text = self._clean_text(year_elem.get_text()) if year_elem else str(datetime.now().year)
+        year_text = self._clean_text(year_elem.get_text()) if year_elem else str(current_year)
 
         try:
             # Parse "Jan 19" + "2026"
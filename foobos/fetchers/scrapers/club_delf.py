@@ -12,6 +12,7 @@ import logging
 import re
 
 from .base import BaseScraper
+from ._playwright_pool import PLAYWRIGHT_AVAILABLE, get_browser
 from ...models import Concert
 from ...utils import get_cached, save_cache
 
@@ -19,12 +20,7 @@ logger = logging.getLogger(__name__)
 
 CLUB_DELF_URL = "https://clubdelf.com/shows/"
 
-# Try to import Playwright
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if not PLAYWRIGHT_AVAILABLE:
     logger.warning("Playwright not available - Club d'Elf scraper will be skipped")
 
 
@@ -54,23 +50,28 @@ class ClubDelfScraper(BaseScraper):
         concerts = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            # Fresh context per fetch; the browser itself stays warm
+            context = get_browser().new_context()
+            try:
+                page = context.new_page()
+                self._block_heavy_resources(page)
 
                 # Navigate to shows page (no custom User-Agent - it triggers bot detection)
-                page.goto(CLUB_DELF_URL, wait_until="networkidle", timeout=30000)
-                page.wait_for_timeout(2000)
+                page.goto(CLUB_DELF_URL, wait_until="domcontentloaded", timeout=30000)
+                try:
+                    page.wait_for_selector(".gigpress-date", timeout=10000)
+                except Exception:
+                    logger.debug(f"[{self.source_name}] No GigPress dates rendered")
 
                 # Get page content
                 content = page.content()
+            finally:
+                context.close()
 
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(content, 'lxml')
-
-                concerts = self._parse_shows(soup)
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(content, 'lxml')
 
-                browser.close()
+            concerts = self._parse_shows(soup)
 
         except Exception as e:
             logger.error(f"[{self.source_name}] Failed to fetch: {e}")
@@ -17,6 +17,14 @@ from ...config import PUNK_GENRES
 
 logger = logging.getLogger(__name__)
 
+# Class-name patterns used to locate event markup, compiled once per process
+EVENT_CLASS_RE = re.compile(r"event", re.I)
+TITLE_CLASS_RE = re.compile(r"title", re.I)
+DATE_CLASS_RE = re.compile(r"date", re.I)
+VENUE_CLASS_RE = re.compile(r"venue|location", re.I)
+TIME_CLASS_RE = re.compile(r"time", re.I)
+PRICE_CLASS_RE = re.compile(r"price|cost", re.I)
+
 
 class Do617Scraper(BaseScraper):
     """Scrape Do617 for Boston concerts."""
@@ -60,9 +68,9 @@ class Do617Scraper(BaseScraper):
         # Do617 uses event cards/listings
         # Look for common event container patterns
         event_containers = (
-            soup.find_all("div", class_=re.compile(r"event", re.I)) or
-            soup.find_all("article", class_=re.compile(r"event", re.I)) or
-            soup.find_all("li", class_=re.compile(r"event", re.I))
+            soup.find_all("div", class_=EVENT_CLASS_RE) or
+            soup.find_all("article", class_=EVENT_CLASS_RE) or
+            soup.find_all("li", class_=EVENT_CLASS_RE)
         )
 
         for container in event_containers:
@@ -79,7 +87,7 @@ class Do617Scraper(BaseScraper):
             title_elem = (
                 container.find("h2") or
                 container.find("h3") or
-                container.find(class_=re.compile(r"title", re.I))
+                container.find(class_=TITLE_CLASS_RE)
             )
             if not title_elem:
                 return None
@@ -90,14 +98,14 @@ class Do617Scraper(BaseScraper):
                 return None
 
             # Extract date
-            date_elem = container.find(class_=re.compile(r"date", re.I))
+            date_elem = container.find(class_=DATE_CLASS_RE)
             date_str = self._clean_text(date_elem.get_text()) if date_elem else ""
             date = parse_date(date_str, default_year=datetime.now().year)
             if not date:
                 return None
 
             # Extract venue
-            venue_elem = container.find(class_=re.compile(r"venue|location", re.I))
+            venue_elem = container.find(class_=VENUE_CLASS_RE)
             venue_name = self._clean_text(venue_elem.get_text()) if venue_elem else "Unknown Venue"
 
             # Extract location (city)
@@ -108,12 +116,12 @@ class Do617Scraper(BaseScraper):
                 venue_location = "Somerville"
 
             # Extract time
-            time_elem = container.find(class_=re.compile(r"time", re.I))
+            time_elem = container.find(class_=TIME_CLASS_RE)
             time_str = self._clean_text(time_elem.get_text()) if time_elem else ""
             time = self._parse_time(time_str)
 
             # Extract price
-            price_elem = container.find(class_=re.compile(r"price|cost", re.I))
+            price_elem = container.find(class_=PRICE_CLASS_RE)
             price_str = self._clean_text(price_elem.get_text()) if price_elem else ""
             price_advance, price_door = self._parse_price(price_str)
 
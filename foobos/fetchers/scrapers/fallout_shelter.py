@@ -11,6 +11,7 @@ import logging
 import re
 
 from .base import BaseScraper
+from ._playwright_pool import PLAYWRIGHT_AVAILABLE, get_browser
 from ...models import Concert
 from ...utils import get_cached, save_cache
 
@@ -18,12 +19,7 @@ logger = logging.getLogger(__name__)
 
 FALLOUT_SHELTER_URL = "https://www.extendedplaysessions.com/"
 
-# Try to import Playwright
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if not PLAYWRIGHT_AVAILABLE:
     logger.warning("Playwright not available - Fallout Shelter scraper will be skipped")
 
 
@@ -53,12 +49,10 @@ class FalloutShelterScraper(BaseScraper):
         concerts = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Set viewport to ensure content loads
-                page.set_viewport_size({"width": 1920, "height": 1080})
+            # Fresh context per fetch; the browser itself stays warm
+            context = get_browser().new_context(viewport={"width": 1920, "height": 1080})
+            try:
+                page = context.new_page()
 
                 # Navigate and wait for initial load
                 logger.info(f"[{self.source_name}] Loading page...")
@@ -77,13 +71,13 @@ class FalloutShelterScraper(BaseScraper):
 
                 # Get page content
                 content = page.content()
+            finally:
+                context.close()
 
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(content, 'lxml')
-
-                concerts = self._parse_events(soup)
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(content, 'lxml')
 
-                browser.close()
+            concerts = self._parse_events(soup)
 
         except Exception as e:
             logger.error(f"[{self.source_name}] Failed to fetch: {e}")
@@ -7,7 +7,6 @@ from datetime import datetime, timedelta
 from typing import List, Optional, Tuple
 import logging
 import re
-import requests
 
 from .base import BaseScraper
 from ...models import Concert
@@ -131,7 +130,7 @@ class ICalVenuesScraper(BaseScraper):
 
         for url in urls_to_fetch:
             try:
-                response = requests.get(url, timeout=30, headers=headers)
+                response = self.session.get(url, timeout=30, headers=headers)
                 response.raise_for_status()
                 ical_text = response.text
 
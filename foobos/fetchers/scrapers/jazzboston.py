@@ -15,6 +15,7 @@ import re
 from bs4 import BeautifulSoup
 
 from .base import BaseScraper
+from ._playwright_pool import PLAYWRIGHT_AVAILABLE, get_browser
 from ...models import Concert
 from ...utils import get_cached, save_cache
 
@@ -29,12 +30,7 @@ VENUE_ALIASES = {
     "regattabar at the charles hotel": ("Regattabar", "Cambridge"),
 }
 
-# Try to import Playwright - it may not be available in all environments
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if not PLAYWRIGHT_AVAILABLE:
     logger.info("Playwright not available - JazzBoston will use static scraping (page 1 only)")
 
 
@@ -76,9 +72,10 @@ class JazzBostonScraper(BaseScraper):
         seen_events = set()
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            # Fresh context per fetch; the browser itself stays warm
+            context = get_browser().new_context()
+            try:
+                page = context.new_page()
 
                 # Navigate and wait for content to load
                 logger.info(f"[{self.source_name}] Loading page with Playwright...")
@@ -133,8 +130,8 @@ class JazzBostonScraper(BaseScraper):
                     except Exception as e:
                         logger.debug(f"[{self.source_name}] Error on page {page_num}: {e}")
                         break
-
-                browser.close()
+            finally:
+                context.close()
 
         except Exception as e:
             logger.error(f"[{self.source_name}] Playwright fetch failed: {e}")
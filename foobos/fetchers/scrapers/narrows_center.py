@@ -9,6 +9,7 @@ import logging
 import re
 
 from .base import BaseScraper
+from ._playwright_pool import PLAYWRIGHT_AVAILABLE, get_browser
 from ...models import Concert
 from ...utils import get_cached, save_cache
 
@@ -16,12 +17,7 @@ logger = logging.getLogger(__name__)
 
 NARROWS_URL = "https://narrowscenter.showare.com/?category=39"
 
-# Try to import Playwright
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if not PLAYWRIGHT_AVAILABLE:
     logger.warning("Playwright not available - Narrows Center scraper will be skipped")
 
 
@@ -51,9 +47,11 @@ class NarrowsCenterScraper(BaseScraper):
         concerts = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+            # Fresh context per fetch; the browser itself stays warm.
+            # _parse_events still reads from the page, so parse before closing.
+            context = get_browser().new_context()
+            try:
+                page = context.new_page()
 
                 # Navigate and wait for content
                 page.goto(NARROWS_URL, wait_until="networkidle", timeout=30000)
@@ -77,8 +75,8 @@ class NarrowsCenterScraper(BaseScraper):
                 soup = BeautifulSoup(content, 'lxml')
 
                 concerts = self._parse_events(soup, page)
-
-                browser.close()
+            finally:
+                context.close()
 
         except Exception as e:
             logger.error(f"[{self.source_name}] Failed to fetch: {e}")
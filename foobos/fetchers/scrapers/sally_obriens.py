@@ -10,7 +10,7 @@ import re
 
 from .base import BaseScraper
 from ...models import Concert
-from ...utils import get_cached, save_cache
+from ...utils import get_cached, save_cache, content_version
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,32 @@ DAYS_OF_WEEK = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturda
 MONTHS = ['january', 'february', 'march', 'april', 'may', 'june',
           'july', 'august', 'september', 'october', 'november', 'december']
 
+# Case-insensitive patterns so the scan can match the raw text without
+# lowercasing every part
+DAY_OF_WEEK_RE = re.compile('|'.join(DAYS_OF_WEEK), re.I)
+TIME_RE = re.compile(r'^(\d{1,4})\s*(am|pm)$', re.I)
+PRICE_RE = re.compile(r'\$(\d+)')
+PRICE_STRIP_RE = re.compile(r'\s*\$\d+\s*')
+FREE_RE = re.compile(r'free|no-cover', re.I)
+
+# Lines that look like band slots but aren't
+SKIP_RE = re.compile(r'free show|no-cover|residency|followed by|here for you|live music|follow us', re.I)
+
+GENRE_TAGS = ("rock", "indie", "folk", "americana")
+FLAGS = ()
+
+# Concert fields that are the same for every Sally O'Brien's show; built once
+# and splatted into each Concert so only the per-event fields vary
+CONCERT_FIELDS = {
+    "venue_id": "sallyobriens",
+    "venue_name": "Sally O'Brien's",
+    "venue_location": "Somerville",
+    "age_requirement": "21+",
+    "flags": FLAGS,
+    "source_url": SALLY_OBRIENS_URL,
+    "genre_tags": GENRE_TAGS,
+}
+
 
 class SallyOBriensScraper(BaseScraper):
     """Scrape events from Sally O'Brien's music calendar."""
@@ -44,25 +70,35 @@ class SallyOBriensScraper(BaseScraper):
             return [Concert.from_dict(c) for c in cached]
 
         concerts = []
+        version = None
 
         try:
-            soup = self._get_soup()
-
-            # Get all the text content - the page structure is not very semantic
-            # We need to parse the text looking for date patterns
-            content = soup.find('main') or soup.find('body')
-            if not content:
-                logger.warning(f"[{self.source_name}] Could not find main content")
-                return []
-
-            # Get the text and find events
-            concerts = self._parse_events(content)
+            html = self._get_html()
+
+            # Reuse the previous parse if the page hasn't changed since
+            version = content_version(html)
+            cached = get_cached("scrape_sally_obriens", version=version)
+            if cached:
+                logger.info(f"[{self.source_name}] Page unchanged, reusing cached data ({len(cached)} events)")
+                concerts = [Concert.from_dict(c) for c in cached]
+            else:
+                soup = self._make_soup(html)
+
+                # Get all the text content - the page structure is not very semantic
+                # We need to parse the text looking for date patterns
+                content = soup.find('main') or soup.find('body')
+                if not content:
+                    logger.warning(f"[{self.source_name}] Could not find main content")
+                    return []
+
+                # Get the text and find events
+                concerts = self._parse_events(content)
 
         except Exception as e:
             logger.error(f"[{self.source_name}] Error fetching: {e}")
 
         # Cache the results
-        save_cache("scrape_sally_obriens", [c.to_dict() for c in concerts])
+        save_cache("scrape_sally_obriens", [c.to_dict() for c in concerts], version=version)
         self._log_fetch_complete(len(concerts))
 
         return concerts
@@ -84,86 +120,78 @@ class SallyOBriensScraper(BaseScraper):
         all_text = content.get_text(separator='|||', strip=True)
         parts = [p.strip() for p in all_text.split('|||') if p.strip()]
 
-        i = 0
-        while i < len(parts) - 3:  # Need at least 4 parts for an event
-            part = parts[i].lower()
+        # Bind per-event helpers once for the scan below
+        parse_month_day = self._parse_month_day
+        normalize_time = self._normalize_time
+        split_bands = self._split_bands
+        source_name = self.source_name
+
+        n = len(parts)
+        for i in range(n - 3):  # Need at least 4 parts for an event
+            part = parts[i]
 
             # Look for day of week (may be concatenated with month, e.g., "Sunday Febr")
-            day_of_week = None
-            for day in DAYS_OF_WEEK:
-                if part.startswith(day):
-                    day_of_week = day
-                    break
-
-            if day_of_week:
-                # Next should be "Month Day" (e.g., "January 19")
-                # But month might be split across parts (e.g., "Sunday Febr" + "uary 1")
-                if i + 1 < len(parts):
-                    # Check if day of week part has extra text (start of month)
-                    extra = part[len(day_of_week):].strip()
-                    date_part = extra + parts[i + 1] if extra else parts[i + 1]
-                    date = self._parse_month_day(date_part, current_year)
-
-                    if date:
-                        # Next should be time (e.g., "730pm")
-                        time_str = "8pm"
-                        band_name = None
-                        price = None
-
-                        if i + 2 < len(parts):
-                            time_candidate = parts[i + 2].lower()
-                            time_match = re.match(r'^(\d{1,4})\s*(am|pm)$', time_candidate)
-                            if time_match:
-                                time_str = self._normalize_time(time_candidate)
-
-                                # Next should be band name
-                                if i + 3 < len(parts):
-                                    band_name = parts[i + 3]
-
-                                    # Check if price is embedded in band name line
-                                    price_match = re.search(r'\$(\d+)', band_name)
-                                    if price_match:
-                                        price = int(price_match.group(1))
-                                        # Remove price from band name
-                                        band_name = re.sub(r'\s*\$\d+\s*', '', band_name).strip()
-
-                                    # Check next line for price/cover info
-                                    if i + 4 < len(parts):
-                                        next_part = parts[i + 4]
-                                        if 'free' in next_part.lower():
-                                            price = 0
-                                        elif 'no-cover' in next_part.lower():
-                                            price = 0
-                                        price_match = re.search(r'\$(\d+)', next_part)
-                                        if price_match:
-                                            price = int(price_match.group(1))
-
-                        if band_name and len(band_name) > 2:
-                            # Skip non-band text
-                            skip_patterns = ['free show', 'no-cover', 'residency', 'followed by',
-                                           'here for you', 'live music', 'follow us']
-                            if not any(p in band_name.lower() for p in skip_patterns):
-                                bands = self._split_bands(band_name)
-
-                                if bands:
-                                    concert = Concert(
-                                        date=date,
-                                        venue_id="sallyobriens",
-                                        venue_name="Sally O'Brien's",
-                                        venue_location="Somerville",
-                                        bands=bands,
-                                        age_requirement="21+",
-                                        price_advance=price,
-                                        price_door=price,
-                                        time=time_str,
-                                        flags=[],
-                                        source=self.source_name,
-                                        source_url=SALLY_OBRIENS_URL,
-                                        genre_tags=["rock", "indie", "folk", "americana"]
-                                    )
-                                    concerts.append(concert)
-
-            i += 1
+            day_match = DAY_OF_WEEK_RE.match(part)
+            if not day_match:
+                continue
+
+            # The loop bound guarantees the next three parts exist:
+            # "Month Day", time and band name
+            p1 = parts[i + 1]
+            p2 = parts[i + 2]
+            p3 = parts[i + 3]
+            p4 = parts[i + 4] if i + 4 < n else None
+
+            # Next should be "Month Day" (e.g., "January 19")
+            # But month might be split across parts (e.g., "Sunday Febr" + "uary 1")
+            extra = part[day_match.end():].strip()
+            date_part = extra + p1 if extra else p1
+            date = parse_month_day(date_part, current_year)
+            if not date:
+                continue
+
+            # Next should be time (e.g., "730pm"); without it there's no band line
+            if not TIME_RE.match(p2):
+                continue
+            time_str = normalize_time(p2)
+
+            # Next should be band name
+            band_name = p3
+            price = None
+
+            # Check if price is embedded in band name line
+            price_match = PRICE_RE.search(band_name)
+            if price_match:
+                price = int(price_match.group(1))
+                # Remove price from band name
+                band_name = PRICE_STRIP_RE.sub('', band_name).strip()
+
+            # Check next line for price/cover info
+            if p4 is not None:
+                if FREE_RE.search(p4):
+                    price = 0
+                price_match = PRICE_RE.search(p4)
+                if price_match:
+                    price = int(price_match.group(1))
+
+            if not band_name or len(band_name) <= 2:
+                continue
+
+            # Skip non-band text
+            if SKIP_RE.search(band_name):
+                continue
+
+            bands = split_bands(band_name)
+            if bands:
+                concerts.append(Concert(
+                    date=date,
+                    bands=bands,
+                    price_advance=price,
+                    price_door=price,
+                    time=time_str,
+                    source=source_name,
+                    **CONCERT_FIELDS
+                ))
 
         return concerts
 
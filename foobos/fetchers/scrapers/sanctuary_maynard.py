@@ -8,15 +8,52 @@ from typing import List, Optional
 import logging
 import re
 
+from bs4 import SoupStrainer
+
 from .base import BaseScraper
 from ...models import Concert
 from ...config import WEEKS_AHEAD
-from ...utils import get_cached, save_cache
+from ...utils import get_cached, save_cache, content_version
 
 logger = logging.getLogger(__name__)
 
 SANCTUARY_URL = "https://www.sanctuarymaynard.com/concerts"
 
+# Only build tree nodes for event containers; the rest of the page is ignored.
+# The strainer sees the raw class attribute ("event featured"), so match the
+# class as a whole word rather than the full attribute value.
+EVENT_STRAINER = SoupStrainer(class_=re.compile(r'(?:^|\s)event(?:\s|$)'))
+
+# Month name mapping (both short and long forms)
+MONTHS = {
+    'jan': 1, 'january': 1,
+    'feb': 2, 'february': 2,
+    'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4,
+    'may': 5,
+    'jun': 6, 'june': 6,
+    'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8,
+    'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11,
+    'dec': 12, 'december': 12
+}
+
+GENRE_TAGS = ()
+FLAGS = ()
+
+# Concert fields that are the same for every Sanctuary show; built once and
+# splatted into each Concert so only the per-event fields vary
+CONCERT_FIELDS = {
+    "venue_id": "sanctuary",
+    "venue_name": "Sanctuary",
+    "venue_location": "Maynard",
+    "age_requirement": "a/a",
+    "flags": FLAGS,
+    "genre_tags": GENRE_TAGS,
+}
+
 
 class SanctuaryMaynardScraper(BaseScraper):
     """Scraper for Sanctuary Maynard concert venue."""
@@ -38,16 +75,26 @@ class SanctuaryMaynardScraper(BaseScraper):
             return [Concert.from_dict(c) for c in cached]
 
         concerts = []
+        version = None
 
         try:
-            soup = self._get_soup()
-            concerts = self._parse_events(soup)
+            html = self._get_html()
+
+            # Reuse the previous parse if the page hasn't changed since
+            version = content_version(html)
+            cached = get_cached("scrape_sanctuary_maynard", version=version)
+            if cached:
+                logger.info(f"[{self.source_name}] Page unchanged, reusing cached data ({len(cached)} events)")
+                concerts = [Concert.from_dict(c) for c in cached]
+            else:
+                soup = self._make_soup(html, parse_only=EVENT_STRAINER)
+                concerts = self._parse_events(soup)
         except Exception as e:
             logger.error(f"[{self.source_name}] Failed to fetch: {e}")
 
         # Cache the results
         if concerts:
-            save_cache("scrape_sanctuary_maynard", [c.to_dict() for c in concerts])
+            save_cache("scrape_sanctuary_maynard", [c.to_dict() for c in concerts], version=version)
 
         self._log_fetch_complete(len(concerts))
         return concerts
@@ -60,8 +107,9 @@ class SanctuaryMaynardScraper(BaseScraper):
         # Find all event containers
         events = soup.find_all(class_='event')
 
+        parse_event = self._parse_event
         for event in events:
-            concert = self._parse_event(event, now)
+            concert = parse_event(event, now)
             if concert:
                 concerts.append(concert)
 
@@ -75,7 +123,8 @@ class SanctuaryMaynardScraper(BaseScraper):
             if not name_elem:
                 return None
 
-            event_name = self._clean_text(name_elem.get_text())
+            # Let BS4 strip the text nodes; _split_bands cleans each band below
+            event_name = name_elem.get_text(' ', strip=True)
             if not event_name:
                 return None
 
@@ -88,9 +137,9 @@ class SanctuaryMaynardScraper(BaseScraper):
             if not details:
                 return None
 
-            # Parse date and time from details text
+            # Walk the details subtree once; date, time and price all parse this string
             details_text = details.get_text()
-            date = self._parse_date(details_text, now.year)
+            date = self._parse_date(details_text, now)
             if not date:
                 return None
 
@@ -121,42 +170,26 @@ class SanctuaryMaynardScraper(BaseScraper):
 
             return Concert(
                 date=date,
-                venue_id="sanctuary",
-                venue_name="Sanctuary",
-                venue_location="Maynard",
                 bands=bands,
-                age_requirement="a/a",
                 price_advance=price_advance,
                 price_door=price_door,
                 time=time_str,
-                flags=[],
                 source=self.source_name,
                 source_url=source_url,
-                genre_tags=[]
+                **CONCERT_FIELDS
             )
 
         except Exception as e:
             logger.debug(f"Error parsing event: {e}")
             return None
 
-    def _parse_date(self, text: str, year: int) -> Optional[datetime]:
-        """Parse date from text like 'Sat, Jan 31, 2026' or 'Saturday, January 24, 2026'."""
-        # Month name mapping (both short and long forms)
-        months = {
-            'jan': 1, 'january': 1,
-            'feb': 2, 'february': 2,
-            'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4,
-            'may': 5,
-            'jun': 6, 'june': 6,
-            'jul': 7, 'july': 7,
-            'aug': 8, 'august': 8,
-            'sep': 9, 'sept': 9, 'september': 9,
-            'oct': 10, 'october': 10,
-            'nov': 11, 'november': 11,
-            'dec': 12, 'december': 12
-        }
+    def _parse_date(self, text: str, now: datetime) -> Optional[datetime]:
+        """Parse date from text like 'Sat, Jan 31, 2026' or 'Saturday, January 24, 2026'.
 
+        Dates without a year are assumed to be in now's year, or the next one if
+        the month has already passed.
+        """
+        year = now.year
         # Match "Day, Mon DD, YYYY" format (short or long month names)
         match = re.search(
             r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+'
@@ -171,11 +204,11 @@ class SanctuaryMaynardScraper(BaseScraper):
             day = int(match.group(2))
             event_year = int(match.group(3)) if match.group(3) else year
 
-            month = months.get(month_name)
+            month = MONTHS.get(month_name)
 
             if month:
                 # Handle year rollover
-                if month < datetime.now().month and event_year == year:
+                if month < now.month and event_year == year:
                     event_year += 1
 
                 try:
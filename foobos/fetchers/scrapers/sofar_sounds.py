@@ -8,26 +8,58 @@ the show itself.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import logging
 import re
 
 from bs4 import BeautifulSoup
 
 from .base import BaseScraper
+from ._playwright_pool import PLAYWRIGHT_AVAILABLE, get_browser
 from ...models import Concert
 from ...config import WEEKS_AHEAD
-from ...utils import get_cached, save_cache
+from ...utils import get_cached, save_cache, config_cache_key
 
 logger = logging.getLogger(__name__)
 
-# Try to import Playwright - required for this scraper
+# Playwright renders the page when the static HTML has no event links
+if not PLAYWRIGHT_AVAILABLE:
+    logger.warning("Playwright not available - Sofar Sounds will use static HTML only")
+
+# selectolax is optional - much faster than BeautifulSoup for the link scan
 try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
 except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    logger.warning("Playwright not available - Sofar Sounds scraper will be disabled")
+    SELECTOLAX_AVAILABLE = False
+
+# Cached results depend on the lookahead window
+SOFAR_CACHE_KEY = config_cache_key("scrape_sofar_sounds", WEEKS_AHEAD)
+
+# Event date like "Fri Jan 30"
+SOFAR_DATE_RE = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+'
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'
+    r'(\d{1,2})',
+    re.IGNORECASE
+)
+
+# Month numbers keyed by the abbreviation in each casing the date regex may capture
+MONTHS = {
+    casing(abbr): number
+    for number, abbr in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)
+    for casing in (str.title, str.lower, str.upper)
+}
+
+# Common venue types, lowercased for substring matching
+VENUE_TYPES = tuple(vt.casefold() for vt in (
+    'Hotel', 'Bar', 'Creative Space', 'Community Space', 'Cocktail Lounge',
+    'Restaurant', 'Gallery', 'Rooftop', 'Loft', 'Studio',
+))
+
+# Skip these as they're not useful tags
+SKIP_TAGS = frozenset(['Alcohol for purchase', 'No alcohol', 'BYOB', 'Sold out', 'Presale'])
 
 
 class SofarSoundsScraper(BaseScraper):
@@ -45,63 +77,70 @@ class SofarSoundsScraper(BaseScraper):
         """Fetch Sofar Sounds Boston events."""
         self._log_fetch_start()
 
-        if not PLAYWRIGHT_AVAILABLE:
-            logger.warning(f"[{self.source_name}] Playwright required but not available")
-            return []
-
         # Check cache first
-        cached = get_cached("scrape_sofar_sounds")
+        cached = get_cached(SOFAR_CACHE_KEY)
         if cached:
             logger.info(f"[{self.source_name}] Using cached data ({len(cached)} events)")
             return [Concert.from_dict(c) for c in cached]
 
         concerts = []
 
+        # Server-rendered HTML is enough when it already has the event links;
+        # only start the browser when they are rendered client-side or the
+        # plain request is blocked
+        try:
+            html = self._get_html()
+        except Exception as e:
+            logger.warning(f"[{self.source_name}] Static fetch failed: {e}")
+            html = ""
+
         try:
-            concerts = self._fetch_with_playwright()
+            if 'href="/events/' in html:
+                concerts = self._parse_events(html)
+            if not concerts:
+                if PLAYWRIGHT_AVAILABLE:
+                    concerts = self._fetch_with_playwright()
+                else:
+                    logger.warning(f"[{self.source_name}] No events in static HTML and Playwright not available")
         except Exception as e:
             logger.error(f"[{self.source_name}] Error fetching Sofar events: {e}")
 
         # Cache the results
         if concerts:
-            save_cache("scrape_sofar_sounds", [c.to_dict() for c in concerts])
+            save_cache(SOFAR_CACHE_KEY, [c.to_dict() for c in concerts])
 
         self._log_fetch_complete(len(concerts))
         return concerts
 
     def _fetch_with_playwright(self) -> List[Concert]:
-        """Fetch events using Playwright."""
-        concerts = []
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
+        """Fetch events using the shared Playwright browser."""
+        context = get_browser().new_context()
+        try:
+            page = context.new_page()
+            self._block_heavy_resources(page)
 
-            # Navigate to Boston city page
+            # Navigate to Boston city page and wait for JS to render the events
             page.goto(self.url, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_timeout(4000)  # Wait for JS to render
+            try:
+                page.wait_for_selector('a[href^="/events/"]', timeout=10000)
+            except Exception:
+                logger.debug(f"[{self.source_name}] No event links rendered")
 
             content = page.content()
-            browser.close()
-
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(content, 'lxml')
-            concerts = self._parse_events(soup)
+        finally:
+            context.close()
 
-        return concerts
+        return self._parse_events(content)
 
-    def _parse_events(self, soup: BeautifulSoup) -> List[Concert]:
+    def _parse_events(self, content: str) -> List[Concert]:
         """Parse events from the Boston city page."""
         concerts = []
         now = datetime.now()
         max_date = now + timedelta(weeks=WEEKS_AHEAD)
 
-        # Find event links - they have href like /events/63920
-        event_links = soup.select('a[href^="/events/"]')
-
-        for link in event_links:
+        for href, text in self._extract_event_links(content):
             try:
-                concert = self._parse_event_link(link, now, max_date)
+                concert = self._parse_event_link(href, text, now, max_date)
                 if concert:
                     concerts.append(concert)
             except Exception as e:
@@ -109,24 +148,37 @@ class SofarSoundsScraper(BaseScraper):
 
         return concerts
 
-    def _parse_event_link(self, link, now: datetime, max_date: datetime) -> Optional[Concert]:
+    def _extract_event_links(self, content: str) -> List[Tuple[str, str]]:
+        """Return (href, text) pairs for event links, e.g. href="/events/63920".
+
+        The link text holds date, neighborhood, venue type, etc. joined by '|'.
+        """
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(content)
+            return [
+                (node.attributes.get('href') or '', node.text(separator='|', strip=True))
+                for node in tree.css('a[href^="/events/"]')
+            ]
+
+        soup = BeautifulSoup(content, 'lxml')
+        return [
+            (link.get('href', ''), link.get_text(separator='|', strip=True))
+            for link in soup.select('a[href^="/events/"]')
+        ]
+
+    def _parse_event_link(self, href: str, text: str, now: datetime,
+                          max_date: datetime) -> Optional[Concert]:
         """Parse a single event link into a Concert."""
-        href = link.get('href', '')
         if not href.startswith('/events/'):
             return None
 
-        # Get the link text which contains date, neighborhood, venue type, etc.
-        text = link.get_text(separator='|', strip=True)
         if not text:
             return None
 
-        # Parse the components
-        parts = [p.strip() for p in text.split('|') if p.strip()]
-        if len(parts) < 2:
-            return None
-
-        # First part is typically the date (e.g., "Fri Jan 30")
-        date = self._parse_date(parts[0])
+        # First part is typically the date (e.g., "Fri Jan 30"); check it
+        # before splitting the rest, most links fall outside the window
+        date_text, _, rest = text.lstrip('|').partition('|')
+        date = self._parse_date(date_text.strip(), now)
         if not date:
             return None
 
@@ -134,26 +186,25 @@ class SofarSoundsScraper(BaseScraper):
         if date < now or date > max_date:
             return None
 
-        # Second part is typically the neighborhood
-        neighborhood = parts[1] if len(parts) > 1 else "Boston"
+        # Parse the remaining components
+        parts = [p for p in (p.strip() for p in rest.split('|')) if p]
+        if not parts:
+            return None
+
+        # Next part is typically the neighborhood
+        neighborhood = parts[0]
 
         # Look for venue type and special tags in remaining parts
         venue_type = None
         special_tags = []
 
-        # Common venue types
-        venue_types = ['Hotel', 'Bar', 'Creative Space', 'Community Space', 'Cocktail Lounge',
-                       'Restaurant', 'Gallery', 'Rooftop', 'Loft', 'Studio']
-
-        # Skip these as they're not useful tags
-        skip_tags = ['Alcohol for purchase', 'No alcohol', 'BYOB', 'Sold out', 'Presale']
-
-        for part in parts[2:]:
+        for part in parts[1:]:
             # Check if it's a venue type
-            if any(vt.lower() in part.lower() for vt in venue_types):
+            part_lower = part.casefold()
+            if any(vt in part_lower for vt in VENUE_TYPES):
                 venue_type = part
             # Check if it's a useful special tag
-            elif part not in skip_tags and not part.startswith('Limit:'):
+            elif part not in SKIP_TAGS and not part.startswith('Limit:'):
                 # Keep interesting tags like "Indoor Rooftop!", "Valentine's Day", etc.
                 if len(part) > 2 and len(part) < 50:
                     special_tags.append(part)
@@ -184,7 +235,7 @@ class SofarSoundsScraper(BaseScraper):
             genre_tags=["indie", "acoustic", "secret show"]
         )
 
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
+    def _parse_date(self, date_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
         """Parse date from format like 'Fri Jan 30' or 'Sat Feb 7'."""
         if not date_str:
             return None
@@ -193,25 +244,16 @@ class SofarSoundsScraper(BaseScraper):
         date_str = date_str.strip()
 
         # Pattern: Day Mon DD (e.g., "Fri Jan 30")
-        match = re.match(
-            r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+'
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+'
-            r'(\d{1,2})',
-            date_str,
-            re.IGNORECASE
-        )
+        match = SOFAR_DATE_RE.match(date_str)
 
         if match:
             month_str = match.group(1)
             day = int(match.group(2))
 
             # Determine year - assume current year, or next year if month is in the past
-            now = datetime.now()
-            month_map = {
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-            }
-            month = month_map.get(month_str.lower()[:3])
+            if now is None:
+                now = datetime.now()
+            month = MONTHS.get(month_str) or MONTHS.get(month_str.lower())
             if not month:
                 return None
 
@@ -8,7 +8,9 @@ Falls back to static scraping if Playwright unavailable.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Callable, List, NamedTuple, Optional, Tuple
+import asyncio
+import functools
 import logging
 import re
 
@@ -17,94 +19,105 @@ from bs4 import BeautifulSoup
 from .base import BaseScraper
 from ...models import Concert
 from ...config import WEEKS_AHEAD
-from ...utils import get_cached, save_cache
+from ...utils import get_cached, save_cache, delete_cache, config_cache_key
 
 logger = logging.getLogger(__name__)
 
 # Try to import Playwright - it may not be available in all environments
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logger.info("Playwright not available - Songkick will use static scraping (limited events)")
 
+# Number of venue calendars loaded at once in the shared browser
+PLAYWRIGHT_CONCURRENCY = 6
+
+# "Load more" fetches further calendar pages, e.g. /venues/4503147/calendar?page=2.
+# Once the URL shape has been seen in a browser it is cached, and later runs page
+# through calendars with plain HTTP requests instead of clicking the button.
+# The TTL is short and the entry is dropped as soon as paging stops working,
+# so a changed site falls back to the browser within a day at most.
+LOAD_MORE_URL_RE = re.compile(r'/venues/\d+/calendar\?(?:[^#]*&)?page=\d+')
+VENUE_ID_PATH_RE = re.compile(r'/venues/\d+/')
+PAGE_PARAM_RE = re.compile(r'page=\d+')
+CALENDAR_PAGING_CACHE_KEY = "songkick_calendar_paging"
+CALENDAR_PAGING_TTL_HOURS = 24
+MAX_CALENDAR_PAGES = 20  # Safety limit, same as the old click limit
+# Markup that identifies a page as a venue calendar (booked or not)
+CALENDAR_MARKUP_SELECTOR = '#calendar-summary, ul.event-listings'
+
+MONTH_PATTERN = (r'Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?'
+                 r'|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?')
+
+# Dates in either order, matched in one pass:
+# Songkick's "Saturday 31 January 2026" or "January 31, 2026" / "Jan 31, 2026"
+SONGKICK_DATE_RE = re.compile(
+    rf'(?P<dmy_day>\d{{1,2}})\s+(?P<dmy_month>{MONTH_PATTERN})\s+(?P<dmy_year>\d{{4}})'
+    rf'|(?P<mdy_month>{MONTH_PATTERN})\s+(?P<mdy_day>\d{{1,2}})(?:st|nd|rd|th)?,?\s+(?P<mdy_year>\d{{4}})',
+    re.IGNORECASE
+)
+
+# Every element _extract_bands may read names from, selected in one pass
+HEADLINER_SELECTOR = '.headliner a, [class*="headliner"] a, .artist-name a'
+SUPPORT_SELECTOR = '.support a, [class*="support"] a'
+BAND_CANDIDATES_SELECTOR = (
+    f'p.artists, p.artists strong, {HEADLINER_SELECTOR}, {SUPPORT_SELECTOR}, '
+    'a[href*="/artists/"], a[href*="/concerts/"]'
+)
+
+# Month numbers by full lowercase name, for Songkick's li titles
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+TIME_RE = re.compile(r'(\d{1,2}(?::\d{2})?\s*(?:am|pm))', re.IGNORECASE)
+SUPPORT_AND_RE = re.compile(r',?\s+and\s+')
+
+
+class SongkickVenue(NamedTuple):
+    """A venue scraped from its Songkick calendar."""
+    name: str
+    id: str
+    location: str
+    songkick_id: str  # Numeric Songkick venue ID
+    age: str
+
 
 # Venues with Songkick pages
-# Each venue has a songkick_id which is the numeric venue ID
-SONGKICK_VENUES = [
-    {
-        "name": "Deep Cuts",
-        "id": "deepcuts",
-        "location": "Medford",
-        "songkick_id": "4503147",
-        "age": "21+",
-    },
-    {
-        "name": "Groton Hill Music Center",
-        "id": "grotonhill",
-        "location": "Groton",
-        "songkick_id": "4447493",
-        "age": "a/a",
-    },
+SONGKICK_VENUES = (
+    SongkickVenue(name="Deep Cuts", id="deepcuts", location="Medford",
+                  songkick_id="4503147", age="21+"),
+    SongkickVenue(name="Groton Hill Music Center", id="grotonhill", location="Groton",
+                  songkick_id="4447493", age="a/a"),
     # City Winery removed - has dedicated CityWineryScraper with more complete data
-    {
-        "name": "Club Passim",
-        "id": "clubpassim",
-        "location": "Cambridge",
-        "songkick_id": "10659",
-        "age": "a/a",
-    },
-    {
-        "name": "The Lilypad",
-        "id": "lilypad",
-        "location": "Cambridge",
-        "songkick_id": "71389",
-        "age": "a/a",
-    },
-    {
-        "name": "ONCE Somerville",
-        "id": "once_somerville",
-        "location": "Somerville",
-        "songkick_id": "3078734",
-        "age": "18+",
-    },
-    {
-        "name": "ONCE at Boynton Yards",
-        "id": "once_boynton",
-        "location": "Somerville",
-        "songkick_id": "4409048",
-        "age": "18+",
-    },
-    {
-        "name": "The 4th Wall",
-        "id": "4thwall",
-        "location": "Arlington",
-        "songkick_id": "4541042",
-        "age": "a/a",
-    },
-    {
-        "name": "Warehouse XI",
-        "id": "warehousexi",
-        "location": "Somerville",
-        "songkick_id": "3118614",
-        "age": "a/a",
-    },
-    {
-        "name": "Arts at the Armory",
-        "id": "armory",
-        "location": "Somerville",
-        "songkick_id": "359916",
-        "age": "a/a",
-    },
-    {
-        "name": "Faces Brewing Co",
-        "id": "facesbrewing",
-        "location": "Malden",
-        "songkick_id": "4422088",
-        "age": "21+",
-    },
-]
+    SongkickVenue(name="Club Passim", id="clubpassim", location="Cambridge",
+                  songkick_id="10659", age="a/a"),
+    SongkickVenue(name="The Lilypad", id="lilypad", location="Cambridge",
+                  songkick_id="71389", age="a/a"),
+    SongkickVenue(name="ONCE Somerville", id="once_somerville", location="Somerville",
+                  songkick_id="3078734", age="18+"),
+    SongkickVenue(name="ONCE at Boynton Yards", id="once_boynton", location="Somerville",
+                  songkick_id="4409048", age="18+"),
+    SongkickVenue(name="The 4th Wall", id="4thwall", location="Arlington",
+                  songkick_id="4541042", age="a/a"),
+    SongkickVenue(name="Warehouse XI", id="warehousexi", location="Somerville",
+                  songkick_id="3118614", age="a/a"),
+    SongkickVenue(name="Arts at the Armory", id="armory", location="Somerville",
+                  songkick_id="359916", age="a/a"),
+    SongkickVenue(name="Faces Brewing Co", id="facesbrewing", location="Malden",
+                  songkick_id="4422088", age="21+"),
+)
+
+
+# Cached results depend on which venues are scraped and the lookahead window
+SONGKICK_CACHE_KEY = config_cache_key(
+    "scrape_songkick_venues",
+    sorted(venue.songkick_id for venue in SONGKICK_VENUES),
+    WEEKS_AHEAD,
+)
 
 
 class SongkickVenuesScraper(BaseScraper):
@@ -123,116 +136,269 @@ class SongkickVenuesScraper(BaseScraper):
         self._log_fetch_start()
 
         # Check cache first
-        cached = get_cached("scrape_songkick_venues")
+        cached = get_cached(SONGKICK_CACHE_KEY)
         if cached:
             logger.info(f"[{self.source_name}] Using cached data ({len(cached)} events)")
             return [Concert.from_dict(c) for c in cached]
 
         all_concerts = []
+        now = datetime.now()
+        max_date = now + timedelta(weeks=WEEKS_AHEAD)
+
+        # Page through calendars over HTTP once the "Load more" URL is known;
+        # otherwise load every calendar in one browser, which also learns it.
+        # Venues neither path covers fall back to static scraping.
+        paging = get_cached(CALENDAR_PAGING_CACHE_KEY, ttl_hours=CALENDAR_PAGING_TTL_HOURS)
+        page_template = paging.get("template") if paging else None
+
+        pages = {}
+        if page_template is None:
+            pages, page_template = self._load_calendars(SONGKICK_VENUES)
 
+        venue_concerts = {}
+        stale_venues = []
         for venue in SONGKICK_VENUES:
             try:
-                concerts = self._fetch_venue_events(venue)
-                logger.info(f"[{self.source_name}] {venue['name']}: {len(concerts)} events")
-                all_concerts.extend(concerts)
+                content = pages.get(venue.id)
+                if content is not None:
+                    soup = BeautifulSoup(content, 'lxml')
+                    concerts = self._parse_venue_events(soup, venue, set(), now, max_date)
+                elif page_template:
+                    concerts = self._fetch_venue_paged(venue, page_template, now, max_date)
+                    if concerts is None:
+                        stale_venues.append(venue)
+                        continue
+                else:
+                    concerts = self._fetch_venue_static(venue, now, max_date)
+                venue_concerts[venue.id] = concerts
             except Exception as e:
-                logger.warning(f"[{self.source_name}] Error fetching {venue['name']}: {e}")
+                logger.warning(f"[{self.source_name}] Error fetching {venue.name}: {e}")
+
+        # A cached paging template that no longer works is dropped, and the
+        # affected venues are loaded the slow way instead
+        if stale_venues:
+            logger.warning(f"[{self.source_name}] Cached calendar paging URL stopped working, "
+                           f"falling back for {len(stale_venues)} venue(s)")
+            delete_cache(CALENDAR_PAGING_CACHE_KEY)
+            pages, _ = self._load_calendars(stale_venues)
+            for venue in stale_venues:
+                try:
+                    content = pages.get(venue.id)
+                    if content is not None:
+                        soup = BeautifulSoup(content, 'lxml')
+                        concerts = self._parse_venue_events(soup, venue, set(), now, max_date)
+                    else:
+                        concerts = self._fetch_venue_static(venue, now, max_date)
+                    venue_concerts[venue.id] = concerts
+                except Exception as e:
+                    logger.warning(f"[{self.source_name}] Error fetching {venue.name}: {e}")
+
+        for venue in SONGKICK_VENUES:
+            if venue.id in venue_concerts:
+                concerts = venue_concerts[venue.id]
+                logger.info(f"[{self.source_name}] {venue.name}: {len(concerts)} events")
+                all_concerts.extend(concerts)
 
         # Cache the results
-        save_cache("scrape_songkick_venues", [c.to_dict() for c in all_concerts])
+        save_cache(SONGKICK_CACHE_KEY, [c.to_dict() for c in all_concerts])
         self._log_fetch_complete(len(all_concerts))
 
         return all_concerts
 
-    def _fetch_venue_events(self, venue: dict) -> List[Concert]:
-        """Fetch events from a Songkick venue calendar page."""
-        # Use Playwright if available for full event loading
-        if PLAYWRIGHT_AVAILABLE:
-            return self._fetch_venue_with_playwright(venue)
-        else:
-            return self._fetch_venue_static(venue)
+    def _load_calendars(self, venues: List[SongkickVenue]) -> Tuple[dict, Optional[str]]:
+        """
+        Load venue calendars in the browser, caching the paging template it learns.
 
-    def _fetch_venue_with_playwright(self, venue: dict) -> List[Concert]:
-        """Fetch venue events using Playwright for JavaScript pagination."""
-        concerts = []
-        seen_events = set()
-        venue_url = f"https://www.songkick.com/venues/{venue['songkick_id']}/calendar"
+        Returns:
+            (dict of venue id -> rendered HTML, paging template or None);
+            the dict is empty when Playwright is unavailable or fails
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            return {}, None
 
+        pages = {}
+        load_more_urls = []
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Navigate and wait for content
-                page.goto(venue_url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(2000)
-
-                # Click "Load more" button repeatedly to get all events
-                max_clicks = 20  # Safety limit
-                clicks = 0
-                while clicks < max_clicks:
+            pages = asyncio.run(self._load_calendars_with_playwright(venues, load_more_urls))
+        except Exception as e:
+            logger.warning(f"[{self.source_name}] Playwright failed: {e}")
+
+        page_template = None
+        if load_more_urls:
+            page_template = self._paging_template(load_more_urls[0])
+            save_cache(CALENDAR_PAGING_CACHE_KEY, {"template": page_template})
+        return pages, page_template
+
+    async def _load_calendars_with_playwright(self, venues: List[SongkickVenue],
+                                              load_more_urls: List[str]) -> dict:
+        """
+        Load venue calendar pages concurrently in a single headless browser.
+
+        Each venue gets its own browser context so cookies don't leak between
+        venues. URLs requested by "Load more" clicks are appended to
+        load_more_urls.
+
+        Returns:
+            Dict of venue id -> rendered HTML, for venues that loaded
+        """
+        pages = {}
+        semaphore = asyncio.Semaphore(PLAYWRIGHT_CONCURRENCY)
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+
+            async def load(venue: SongkickVenue) -> None:
+                async with semaphore:
+                    context = await browser.new_context()
                     try:
-                        load_more = page.locator('button:has-text("Load more"), a:has-text("Load more")')
-                        if load_more.count() > 0 and load_more.first.is_visible():
-                            load_more.first.click()
-                            page.wait_for_timeout(1500)
-                            clicks += 1
-                        else:
-                            break
-                    except Exception:
-                        break
-
-                # Get final page content
-                content = page.content()
-                browser.close()
-
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(content, 'lxml')
-                concerts = self._parse_venue_events(soup, venue, seen_events)
+                        page = await context.new_page()
+                        await self._block_heavy_resources(page)
+                        pages[venue.id] = await self._load_calendar(page, venue, load_more_urls)
+                    except Exception as e:
+                        logger.warning(f"[{self.source_name}] Playwright failed for {venue.name}: {e}")
+                    finally:
+                        await context.close()
 
-        except Exception as e:
-            logger.warning(f"[{self.source_name}] Playwright failed for {venue['name']}: {e}")
-            # Fall back to static scraping
-            return self._fetch_venue_static(venue)
+            try:
+                await asyncio.gather(*(load(venue) for venue in venues))
+            finally:
+                await browser.close()
+
+        return pages
+
+    async def _load_calendar(self, page, venue: SongkickVenue, load_more_urls: List[str]) -> str:
+        """Open a venue calendar and expand it via "Load more"; returns the HTML."""
+        venue_url = f"https://www.songkick.com/venues/{venue.songkick_id}/calendar"
+
+        def on_response(response):
+            if response.request.method == "GET" and LOAD_MORE_URL_RE.search(response.url):
+                load_more_urls.append(response.url)
+
+        page.on("response", on_response)
+
+        # Navigate and wait for content
+        await page.goto(venue_url, wait_until="domcontentloaded", timeout=30000)
+        try:
+            await page.wait_for_selector('ul.event-listings', timeout=10000)
+        except Exception:
+            logger.debug(f"[{self.source_name}] No event listings rendered for {venue.name}")
+
+        # Click "Load more" button repeatedly to get all events
+        max_clicks = 20  # Safety limit
+        clicks = 0
+        while clicks < max_clicks:
+            try:
+                load_more = page.locator('button:has-text("Load more"), a:has-text("Load more")')
+                if await load_more.count() > 0 and await load_more.first.is_visible():
+                    await load_more.first.click()
+                    await page.wait_for_timeout(1500)
+                    clicks += 1
+                else:
+                    break
+            except Exception:
+                break
+
+        return await page.content()
+
+    def _paging_template(self, load_more_url: str) -> str:
+        """Turn a captured "Load more" URL into a str.format template."""
+        template = VENUE_ID_PATH_RE.sub('/venues/{songkick_id}/', load_more_url, count=1)
+        template = PAGE_PARAM_RE.sub('page={page}', template, count=1)
+        return template.split('#')[0]
+
+    def _fetch_venue_paged(self, venue: SongkickVenue, page_template: str,
+                           now: datetime, max_date: datetime) -> Optional[List[Concert]]:
+        """
+        Fetch venue events page by page over HTTP using the "Load more" URL.
+
+        Returns None when page 1 fails or isn't a calendar page, which means
+        the cached template no longer works and the caller should fall back.
+        A calendar with nothing in the lookahead window returns [].
+        """
+        concerts = []
+        seen_events = set()
+
+        for page_num in range(1, MAX_CALENDAR_PAGES + 1):
+            page_url = page_template.format(songkick_id=venue.songkick_id, page=page_num)
+            try:
+                soup = self._get_soup(page_url)
+                if page_num == 1 and not soup.select_one(CALENDAR_MARKUP_SELECTOR):
+                    logger.warning(f"[{self.source_name}] Paged calendar for {venue.name} has no event listings")
+                    return None
+                page_concerts = self._parse_venue_events(soup, venue, seen_events, now, max_date)
+            except Exception as e:
+                logger.error(f"Error paging Songkick venue {venue.name}: {e}")
+                if page_num == 1:
+                    return None
+                break
+            # Calendars are chronological, so a page with nothing new means
+            # we've run out of events or passed the lookahead window
+            if not page_concerts:
+                break
+            concerts.extend(page_concerts)
 
         return concerts
 
-    def _fetch_venue_static(self, venue: dict) -> List[Concert]:
+    def _fetch_venue_static(self, venue: SongkickVenue, now: datetime, max_date: datetime) -> List[Concert]:
         """Fetch venue events using static HTTP request (limited events)."""
         concerts = []
         seen_events = set()
-        venue_url = f"https://www.songkick.com/venues/{venue['songkick_id']}/calendar"
+        venue_url = f"https://www.songkick.com/venues/{venue.songkick_id}/calendar"
 
         try:
             soup = self._get_soup(venue_url)
-            concerts = self._parse_venue_events(soup, venue, seen_events)
+            concerts = self._parse_venue_events(soup, venue, seen_events, now, max_date)
         except Exception as e:
-            logger.error(f"Error fetching Songkick venue {venue['name']}: {e}")
+            logger.error(f"Error fetching Songkick venue {venue.name}: {e}")
 
         return concerts
 
-    def _parse_venue_events(self, soup, venue: dict, seen_events: set) -> List[Concert]:
+    def _parse_venue_events(self, soup, venue: SongkickVenue, seen_events: set,
+                            now: datetime, max_date: datetime) -> List[Concert]:
         """Parse events from Songkick venue page HTML."""
         concerts = []
 
+        # Fields shared by every concert at this venue
+        concert_fields = {
+            "venue_id": venue.id,
+            "venue_name": venue.name,
+            "venue_location": venue.location,
+            "age_requirement": venue.age,
+            "price_advance": None,
+            "price_door": None,
+            "flags": (),
+            "source": self.source_name,
+            "source_url": f"https://www.songkick.com/venues/{venue.songkick_id}",
+            "genre_tags": (),
+        }
+
         # Find the upcoming concerts section (avoid past concerts)
         upcoming_section = soup.select_one('#calendar-summary')
         if not upcoming_section:
             # Try finding the event listings ul directly
             upcoming_section = soup
 
+        # Skip listings under a "past concerts" heading. Headings and listings
+        # come back in document order, so the last heading seen is the one
+        # each listing sits under; only the heading before the section needs
+        # a backward search.
+        in_past = False
+        if upcoming_section is not soup:
+            header = upcoming_section.find_previous('h2')
+            in_past = header is not None and 'past' in header.get_text().lower()
+
         # Find event listings - look for li elements with title attribute (date)
         # Structure: <li title="Saturday 31 January 2026">
-        event_lists = upcoming_section.select('ul.event-listings')
-        for event_list in event_lists:
-            # Skip if this is the past concerts section
-            parent_header = event_list.find_previous('h2')
-            if parent_header and 'past' in parent_header.get_text().lower():
+        for elem in upcoming_section.select('h2, ul.event-listings'):
+            if elem.name == 'h2':
+                in_past = 'past' in elem.get_text().lower()
+                continue
+            if in_past:
                 continue
 
-            for event in event_list.select('li[title]'):
+            for event in elem.select('li[title]'):
                 try:
-                    concert = self._parse_event(event, venue)
+                    concert = self._parse_event(event, concert_fields, now, max_date)
                     if concert:
                         # Deduplicate within this venue (same date + headliner)
                         event_key = (concert.date.strftime('%Y-%m-%d'),
@@ -245,16 +411,19 @@ class SongkickVenuesScraper(BaseScraper):
 
         return concerts
 
-    def _parse_event(self, event_elem, venue: dict) -> Optional[Concert]:
+    def _parse_event(self, event_elem, concert_fields: dict, now: datetime,
+                     max_date: datetime) -> Optional[Concert]:
         """Parse a single event element into a Concert."""
+        # Only the fallbacks need the whole card's text; walk it at most once
+        full_text = functools.cache(lambda: self._clean_text(event_elem.get_text()))
+
         # Extract date
-        date = self._extract_date(event_elem)
+        date = self._extract_date(event_elem, full_text)
         if not date:
             return None
 
         # Only include future events within configured lookahead
-        now = datetime.now()
-        if date < now or date > now + timedelta(weeks=WEEKS_AHEAD):
+        if date < now or date > max_date:
             return None
 
         # Extract artist/band name
@@ -263,45 +432,28 @@ class SongkickVenuesScraper(BaseScraper):
             return None
 
         # Extract time
-        time_str = self._extract_time(event_elem)
-
-        return Concert(
-            date=date,
-            venue_id=venue["id"],
-            venue_name=venue["name"],
-            venue_location=venue["location"],
-            bands=bands,
-            age_requirement=venue["age"],
-            price_advance=None,
-            price_door=None,
-            time=time_str,
-            flags=[],
-            source=self.source_name,
-            source_url=f"https://www.songkick.com/venues/{venue['songkick_id']}",
-            genre_tags=[]
-        )
-
-    def _extract_date(self, event_elem) -> Optional[datetime]:
-        """Extract date from event element."""
-        # Try li title attribute first (e.g., title="Saturday 31 January 2026")
-        title = event_elem.get('title', '')
-        if title:
-            date = self._parse_date_text(title)
-            if date:
-                return date
+        time_str = self._extract_time(event_elem, full_text)
 
-        # Try datetime attribute
+        return Concert(date=date, bands=bands, time=time_str, **concert_fields)
+
+    def _extract_date(self, event_elem, full_text: Callable[[], str]) -> Optional[datetime]:
+        """Extract date from event element."""
+        # Try datetime attribute first - ISO needs no text matching
         time_elem = event_elem.select_one('time[datetime]')
         if time_elem and time_elem.get('datetime'):
             try:
-                dt_str = time_elem['datetime']
-                # Handle ISO format: 2026-01-31T20:00:00-0500
-                if 'T' in dt_str:
-                    dt_str = dt_str.split('T')[0]
-                return datetime.strptime(dt_str, "%Y-%m-%d")
+                # Handle ISO format: 2026-01-31T20:00:00-0500 (date part only)
+                return datetime.fromisoformat(time_elem['datetime'].partition('T')[0])
             except ValueError:
                 pass
 
+        # Try li title attribute (e.g., title="Saturday 31 January 2026")
+        title = event_elem.get('title', '')
+        if title:
+            date = self._parse_title_date(title) or self._parse_date_text(title)
+            if date:
+                return date
+
         # Try date text patterns
         date_elem = event_elem.select_one('.date')
         if not date_elem:
@@ -312,49 +464,71 @@ class SongkickVenuesScraper(BaseScraper):
             return self._parse_date_text(date_text)
 
         # Look for month/day pattern in any text
-        full_text = self._clean_text(event_elem.get_text())
-        return self._parse_date_text(full_text)
+        return self._parse_date_text(full_text())
+
+    def _parse_title_date(self, title: str) -> Optional[datetime]:
+        """Parse Songkick's usual li title, 'Saturday 31 January 2026', without regex."""
+        try:
+            _, day, month, year = title.split(maxsplit=3)
+            return datetime(int(year), MONTHS[month.lower()], int(day))
+        except (ValueError, KeyError):
+            return None
 
     def _parse_date_text(self, text: str) -> Optional[datetime]:
         """Parse date from text like 'Friday, January 31, 2026' or 'Saturday 31 January 2026'."""
         if not text:
             return None
 
-        # Common date patterns
-        patterns = [
-            # Songkick format: "Saturday 31 January 2026" (day before month)
-            (r'(\d{1,2})\s+(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{4})', '%d %B %Y'),
-            # Full date with year: "January 31, 2026"
-            (r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})', '%B %d %Y'),
-            # Short month with year: "Jan 31, 2026"
-            (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})', '%b %d %Y'),
-        ]
-
-        for pattern, fmt in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    if fmt == '%d %B %Y':
-                        # Day month year format
-                        date_str = f"{match.group(1)} {match.group(2)} {match.group(3)}"
-                    else:
-                        # Month day year format
-                        date_str = f"{match.group(1)} {match.group(2)} {match.group(3)}"
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
+        match = SONGKICK_DATE_RE.search(text)
+        if not match:
+            return None
 
-        return None
+        if match.group('dmy_day'):
+            day, month, year = match.group('dmy_day', 'dmy_month', 'dmy_year')
+        else:
+            day, month, year = match.group('mdy_day', 'mdy_month', 'mdy_year')
+
+        # Abbreviated month names ("Jan") need %b, full names %B
+        month_format = '%b' if len(month) == 3 else '%B'
+        try:
+            return datetime.strptime(f"{day} {month} {year}", f"%d {month_format} %Y")
+        except ValueError:
+            return None
 
     def _extract_bands(self, event_elem) -> List[str]:
         """Extract band names from event element."""
         bands = []
 
+        # Collect every candidate element in one traversal, then apply the
+        # fallbacks below in priority order
+        artists_elem = None
+        artist_strongs = []
+        headliner_link = None
+        support_links = []
+        artist_links = []
+        concert_links = []
+        for tag in event_elem.select(BAND_CANDIDATES_SELECTOR):
+            if tag.name == 'p':
+                if artists_elem is None:
+                    artists_elem = tag
+            elif tag.name == 'strong':
+                if tag.find_parent('p') is artists_elem:
+                    artist_strongs.append(tag)
+            else:
+                if headliner_link is None and tag.css.match(HEADLINER_SELECTOR):
+                    headliner_link = tag
+                if tag.css.match(SUPPORT_SELECTOR):
+                    support_links.append(tag)
+                href = tag.get('href', '')
+                if '/artists/' in href:
+                    artist_links.append(tag)
+                if '/concerts/' in href:
+                    concert_links.append(tag)
+
         # Songkick structure: <p class="artists summary"> -> <span><strong>Headliner</strong> Support1, Support2, and Support3</span>
-        artists_elem = event_elem.select_one('p.artists')
         if artists_elem:
             # Get main artist from strong tag
-            for strong in artists_elem.select('strong'):
+            for strong in artist_strongs:
                 band_name = self._clean_text(strong.get_text())
                 if band_name and band_name not in bands and len(band_name) > 1:
                     bands.append(band_name)
@@ -379,27 +553,25 @@ class SongkickVenuesScraper(BaseScraper):
                                     bands.append(band)
 
         # Try headliner/support structure
-        if not bands:
-            headliner = event_elem.select_one('.headliner a, [class*="headliner"] a, .artist-name a')
-            if headliner:
-                bands.append(self._clean_text(headliner.get_text()))
+        if not bands and headliner_link:
+            bands.append(self._clean_text(headliner_link.get_text()))
 
         # Try support acts
-        for support in event_elem.select('.support a, [class*="support"] a'):
+        for support in support_links:
             band_name = self._clean_text(support.get_text())
             if band_name and band_name not in bands:
                 bands.append(band_name)
 
         # Try generic artist links
         if not bands:
-            for artist_link in event_elem.select('a[href*="/artists/"]'):
+            for artist_link in artist_links:
                 band_name = self._clean_text(artist_link.get_text())
                 if band_name and band_name not in bands and len(band_name) > 1:
                     bands.append(band_name)
 
         # Try concert links which have artist names
         if not bands:
-            for concert_link in event_elem.select('a[href*="/concerts/"]'):
+            for concert_link in concert_links:
                 link_text = self._clean_text(concert_link.get_text())
                 if link_text and link_text not in bands and len(link_text) > 1:
                     # Avoid "Buy tickets" type links
@@ -415,7 +587,7 @@ class SongkickVenuesScraper(BaseScraper):
 
         bands = []
         # Replace " and " with comma for easier splitting
-        text = re.sub(r',?\s+and\s+', ', ', text)
+        text = SUPPORT_AND_RE.sub(', ', text)
         # Split by comma
         parts = text.split(',')
         for part in parts:
@@ -426,7 +598,7 @@ class SongkickVenuesScraper(BaseScraper):
 
         return bands
 
-    def _extract_time(self, event_elem) -> str:
+    def _extract_time(self, event_elem, full_text: Callable[[], str]) -> str:
         """Extract time from event element."""
         # Try time element
         time_elem = event_elem.select_one('.time, [class*="time"]')
@@ -435,8 +607,7 @@ class SongkickVenuesScraper(BaseScraper):
             return self._parse_time(time_text)
 
         # Try to find time in full text
-        full_text = self._clean_text(event_elem.get_text())
-        match = re.search(r'(\d{1,2}(?::\d{2})?\s*(?:am|pm))', full_text, re.IGNORECASE)
+        match = TIME_RE.search(full_text())
         if match:
             return self._parse_time(match.group(1))
 
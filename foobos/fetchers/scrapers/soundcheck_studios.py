@@ -4,7 +4,7 @@ https://www.soundcheck-studios.com/shows
 """
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 import logging
 import re
 
@@ -16,7 +16,18 @@ from ...utils import get_cached, save_cache
 
 logger = logging.getLogger(__name__)
 
+# selectolax is optional - much faster than BeautifulSoup for the item scan
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 SOUNDCHECK_URL = "https://www.soundcheck-studios.com/shows"
+SOUNDCHECK_DATE_FORMAT = "%B %d, %Y"
+
+# Tribute/cover band indicators - such titles are kept as a single entity
+TRIBUTE_RE = re.compile(r'\(.*(?:tribute|cover).*\)|tribute to|tribute band', re.IGNORECASE)
 
 
 class SoundcheckStudiosScraper(BaseScraper):
@@ -46,8 +57,8 @@ class SoundcheckStudiosScraper(BaseScraper):
             return [Concert.from_dict(c) for c in cached]
 
         try:
-            soup = self._get_soup()
-            concerts = self._parse_events(soup)
+            html = self._get_html()
+            concerts = self._parse_events(html)
         except Exception as e:
             logger.error(f"Failed to fetch Soundcheck Studios events: {e}")
             return []
@@ -58,49 +69,39 @@ class SoundcheckStudiosScraper(BaseScraper):
 
         return concerts
 
-    def _parse_events(self, soup) -> List[Concert]:
-        """Parse events from the Soundcheck Studios page.
-
-        The page uses hidden .ec-col-item elements containing event data:
-        - .title: Artist/event name
-        - .start-date: Date (e.g., "April 3, 2026")
-        - .webflow-link: Link to event detail page
-        """
+    def _parse_events(self, html: str) -> List[Concert]:
+        """Parse events from the Soundcheck Studios page."""
         concerts = []
 
-        # Find all event containers
-        event_items = soup.select('.ec-col-item')
-
-        for item in event_items:
+        for raw_title, raw_date, href in self._extract_items(html):
             try:
                 # Extract title/artist
-                title_elem = item.select_one('.title')
-                if not title_elem:
+                if raw_title is None:
                     continue
-                title = self._clean_text(title_elem.get_text())
+                title = self._clean_text(raw_title)
                 if not title:
                     continue
 
                 # Extract date
-                date_elem = item.select_one('.start-date')
-                if not date_elem:
+                if raw_date is None:
                     continue
-                date_str = self._clean_text(date_elem.get_text())
+                date_str = self._clean_text(raw_date)
                 if not date_str:
                     continue
 
-                # Parse date (handles various formats like "April 3, 2026")
+                # Parse date - usually "April 3, 2026", dateutil handles the rest
                 try:
-                    date = date_parser.parse(date_str)
-                except (ValueError, TypeError):
-                    logger.debug(f"Could not parse date: {date_str}")
-                    continue
+                    date = datetime.strptime(date_str, SOUNDCHECK_DATE_FORMAT)
+                except ValueError:
+                    try:
+                        date = date_parser.parse(date_str)
+                    except (ValueError, TypeError):
+                        logger.debug(f"Could not parse date: {date_str}")
+                        continue
 
                 # Extract event link if available
-                link_elem = item.select_one('.webflow-link')
                 event_url = None
-                if link_elem and link_elem.get('href'):
-                    href = link_elem.get('href')
+                if href:
                     if href.startswith('/'):
                         event_url = f"https://www.soundcheck-studios.com{href}"
                     elif href.startswith('http'):
@@ -134,6 +135,43 @@ class SoundcheckStudiosScraper(BaseScraper):
 
         return concerts
 
+    def _extract_items(self, html: str) -> List[Tuple[Optional[str], Optional[str], Optional[str]]]:
+        """Return raw (title, date, href) for each event on the page.
+
+        The page uses hidden .ec-col-item elements containing event data:
+        - .title: Artist/event name
+        - .start-date: Date (e.g., "April 3, 2026")
+        - .webflow-link: Link to event detail page
+
+        Missing elements come back as None.
+        """
+        items = []
+
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html)
+            for node in tree.css('.ec-col-item'):
+                title_node = node.css_first('.title')
+                date_node = node.css_first('.start-date')
+                link_node = node.css_first('.webflow-link')
+                items.append((
+                    title_node.text() if title_node is not None else None,
+                    date_node.text() if date_node is not None else None,
+                    link_node.attributes.get('href') if link_node is not None else None,
+                ))
+            return items
+
+        soup = self._make_soup(html)
+        for item in soup.select('.ec-col-item'):
+            title_elem = item.select_one('.title')
+            date_elem = item.select_one('.start-date')
+            link_elem = item.select_one('.webflow-link')
+            items.append((
+                title_elem.get_text() if title_elem else None,
+                date_elem.get_text() if date_elem else None,
+                link_elem.get('href') if link_elem else None,
+            ))
+        return items
+
     def _parse_title(self, title: str) -> List[str]:
         """Parse event title to extract band names.
 
@@ -146,15 +184,8 @@ class SoundcheckStudiosScraper(BaseScraper):
             return []
 
         # Check for tribute/cover band indicators and keep as single entity
-        tribute_patterns = [
-            r'\(.*tribute.*\)',
-            r'\(.*cover.*\)',
-            r'tribute to',
-            r'tribute band',
-        ]
-        for pattern in tribute_patterns:
-            if re.search(pattern, title, re.IGNORECASE):
-                return [title]
+        if TRIBUTE_RE.search(title):
+            return [title]
 
         # Use base class band splitting for standard formats
         bands = self._split_bands(title)
@@ -4,19 +4,62 @@ https://www.thebebopboston.com/new-events
 """
 
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 import logging
 import re
 
 from .base import BaseScraper
 from ...models import Concert
 from ...config import WEEKS_AHEAD
-from ...utils import get_cached, save_cache
+from ...utils import get_cached_pickle, save_cache_pickle
 
 logger = logging.getLogger(__name__)
 
+# selectolax is optional - the page is only flattened to text, so its C text
+# extraction saves building a full BeautifulSoup tree
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
 BEBOP_URL = "https://www.thebebopboston.com/new-events"
 
+# Per-month pages are revalidated with a conditional GET, so their parsed
+# events can be kept much longer than the overall result cache
+PAGE_CACHE_TTL_HOURS = 24 * 7
+
+# Date lines like "Saturday, January 31, 2026, 10:30 PM – 11:59 PM"
+DATE_RE = re.compile(
+    r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})'
+)
+WEEKDAY_RE = re.compile(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),')
+TIME_RE = re.compile(r'(\d{1,2}:\d{2})\s*(AM|PM)', re.I)
+DIGITS_RE = re.compile(r'^\d+$')
+
+# How many lines before a date its title may appear
+TITLE_LOOKBACK = 4
+
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Venue info lines that never interrupt a title: exact matches, or lines
+# containing address/location tokens
+SKIP_EXACT = frozenset({'the bebop', 'google maps', 'view map', 'add to calendar'})
+SKIP_CONTAINS_RE = re.compile(r'boylston|boston, ma|united states')
+
+# Elements whose text is never page content
+NON_TEXT_TAGS = ['script', 'style', 'noscript', 'template']
+
+# Title suffixes to strip
+TICKETS_SUFFIX_RE = re.compile(r'\s*-\s*Tickets?\s*$', re.I)
+BEBOP_SUFFIX_RE = re.compile(r'\s*\|\s*The Bebop\s*$', re.I)
+AT_BEBOP_SUFFIX_RE = re.compile(r'\s+at The Bebop!?\s*$', re.I)
+
 
 class TheBebopScraper(BaseScraper):
     """Scraper for The Bebop in Boston's South End."""
@@ -32,10 +75,10 @@ class TheBebopScraper(BaseScraper):
         self._log_fetch_start()
 
         # Check cache first
-        cached = get_cached("scrape_the_bebop")
+        cached = get_cached_pickle("scrape_the_bebop")
         if cached:
             logger.info(f"[{self.source_name}] Using cached data ({len(cached)} events)")
-            return [Concert.from_dict(c) for c in cached]
+            return cached
 
         all_concerts = []
 
@@ -52,142 +95,132 @@ class TheBebopScraper(BaseScraper):
 
             try:
                 url = f"{BEBOP_URL}?view=calendar&month={target_month:02d}-{target_year}"
-                soup = self._get_soup(url)
-                concerts = self._parse_events(soup)
+                page_key = f"scrape_the_bebop_page_{target_year}_{target_month:02d}"
+                page = get_cached_pickle(page_key, ttl_hours=PAGE_CACHE_TTL_HOURS)
+
+                html, validators = self._get_html_if_modified(url, page and page["validators"])
+                if html is None:
+                    logger.debug(f"[{self.source_name}] {target_month:02d}-{target_year} unchanged, reusing parsed events")
+                    concerts = page["concerts"]
+                else:
+                    concerts = self._parse_events(html)
+
+                if validators and any(validators.values()):
+                    save_cache_pickle(page_key, {"validators": validators, "concerts": concerts})
                 all_concerts.extend(concerts)
             except Exception as e:
                 logger.warning(f"[{self.source_name}] Error fetching {target_month:02d}-{target_year}: {e}")
 
-        # Deduplicate by date + bands
-        seen = set()
-        unique_concerts = []
+        # Deduplicate by date + bands, keeping the first of each in order
+        unique = {}
         for c in all_concerts:
-            key = f"{c.date.strftime('%Y-%m-%d')}-{'-'.join(c.bands)}"
-            if key not in seen:
-                seen.add(key)
-                unique_concerts.append(c)
+            unique.setdefault((c.date.toordinal(), tuple(c.bands)), c)
+        unique_concerts = list(unique.values())
 
         # Cache the results
-        save_cache("scrape_the_bebop", [c.to_dict() for c in unique_concerts])
+        save_cache_pickle("scrape_the_bebop", unique_concerts)
         self._log_fetch_complete(len(unique_concerts))
 
         return unique_concerts
 
-    def _parse_events(self, soup) -> List[Concert]:
+    def _page_text(self, html: str) -> str:
+        """Flatten the page to newline-separated text, one text node per line."""
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html)
+            tree.strip_tags(NON_TEXT_TAGS)
+            node = tree.body or tree.root
+            return node.text(separator='\n', strip=True) if node else ''
+
+        return self._make_soup(html).get_text(separator='\n', strip=True)
+
+    def _parse_events(self, html: str) -> List[Concert]:
         """Parse events from the Squarespace events page."""
         concerts = []
 
         # Get all text with separator to preserve structure
-        all_text = soup.get_text(separator='\n', strip=True)
-        lines = [l.strip() for l in all_text.split('\n') if l.strip()]
+        all_text = self._page_text(html)
+        # Text nodes are already stripped; multi-line nodes still need each
+        # line stripped, once
+        lines = [l for l in map(str.strip, all_text.splitlines()) if l]
 
-        # Skip patterns for venue info - these are exact matches or line starts
-        skip_exact = ['the bebop', 'google maps', 'view map', 'add to calendar']
-        skip_contains = ['boylston', 'boston, ma', 'united states']
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        # The event title comes before its date on this site. Each line is
+        # classified once, tracking the most recent line that could be a title
+        title_candidate = None
+        title_index = -1
 
+        for i, line in enumerate(lines):
             # Look for date patterns like "Saturday, January 31, 2026, 10:30 PM – 11:59 PM"
-            date_match = re.match(
-                r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+'
-                r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})',
-                line
-            )
-
-            if date_match:
-                month = date_match.group(2)
-                day = int(date_match.group(3))
-                year = int(date_match.group(4))
-
-                # Extract time from the same line
-                time_match = re.search(r'(\d{1,2}:\d{2})\s*(AM|PM)', line, re.I)
-                time_str = "10pm"
-                if time_match:
-                    hour_min = time_match.group(1)
-                    ampm = time_match.group(2).lower()
-                    time_str = f"{hour_min}{ampm}"
-
-                # Parse the date
-                try:
-                    months = {
-                        'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                        'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                        'september': 9, 'october': 10, 'november': 11, 'december': 12
-                    }
-                    month_num = months.get(month.lower())
-                    if month_num:
-                        date = datetime(year, month_num, day)
-                    else:
-                        i += 1
-                        continue
-                except ValueError:
-                    i += 1
-                    continue
-
-                # Look for event title in PRECEDING lines (title comes before date on this site)
-                title = None
-                j = i - 1
-                while j >= 0 and j > i - 5:
-                    candidate = lines[j].strip()
-                    candidate_lower = candidate.lower()
-
-                    # Skip empty lines
-                    if not candidate:
-                        j -= 1
-                        continue
-
-                    # Skip exact venue info matches (e.g., "The Bebop" by itself)
-                    if candidate_lower in skip_exact:
-                        j -= 1
-                        continue
-
-                    # Skip lines containing address/location info
-                    if any(p in candidate_lower for p in skip_contains):
-                        j -= 1
-                        continue
-
-                    # Skip if it looks like another date/time line
-                    if re.match(r'(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),', candidate):
-                        break
-
-                    # Skip pure numbers (like addresses) or short strings
-                    if re.match(r'^\d+$', candidate) or len(candidate) <= 2:
-                        j -= 1
-                        continue
-
-                    # This is likely the title
-                    title = candidate
-                    break
-
-                if title and len(title) > 2:
-                    # Clean up title - remove common suffixes
-                    title = re.sub(r'\s*-\s*Tickets?\s*$', '', title, flags=re.I)
-                    title = re.sub(r'\s*\|\s*The Bebop\s*$', '', title, flags=re.I)
-                    title = re.sub(r'\s+at The Bebop!?\s*$', '', title, flags=re.I)
-
-                    bands = self._split_bands(title)
-                    if not bands:
-                        bands = [title]
-
-                    concert = Concert(
-                        date=date,
-                        venue_id="bebop",
-                        venue_name="The Bebop",
-                        venue_location="Boston",
-                        bands=bands,
-                        age_requirement="21+",
-                        price_advance=None,
-                        price_door=None,
-                        time=time_str,
-                        flags=[],
-                        source=self.source_name,
-                        source_url=BEBOP_URL,
-                        genre_tags=["jazz", "soul", "funk"]
-                    )
+            date_match = DATE_RE.match(line)
+            if date_match and title_candidate and i - title_index <= TITLE_LOOKBACK:
+                concert = self._parse_event(date_match, line, title_candidate)
+                if concert:
                     concerts.append(concert)
 
-            i += 1
+            line_lower = line.lower()
+
+            # Venue info (e.g., "The Bebop" by itself, address lines) never
+            # interrupts a title
+            if line_lower in SKIP_EXACT or SKIP_CONTAINS_RE.search(line_lower):
+                continue
+
+            # Another date/time line - the title before it belongs to that event
+            if WEEKDAY_RE.match(line):
+                title_candidate = None
+                continue
+
+            # Skip pure numbers (like addresses) or short strings
+            if DIGITS_RE.match(line) or len(line) <= 2:
+                continue
+
+            title_candidate = line
+            title_index = i
 
         return concerts
+
+    def _parse_event(self, date_match, line: str, title: str) -> Optional[Concert]:
+        """Build a Concert from a matched date line and the title preceding it."""
+        month = date_match.group(2)
+        day = int(date_match.group(3))
+        year = int(date_match.group(4))
+
+        # Parse the date
+        month_num = MONTHS.get(month.lower())
+        if not month_num:
+            return None
+        try:
+            date = datetime(year, month_num, day)
+        except ValueError:
+            return None
+
+        # Extract time from the same line
+        time_match = TIME_RE.search(line)
+        time_str = "10pm"
+        if time_match:
+            hour_min = time_match.group(1)
+            ampm = time_match.group(2).lower()
+            time_str = f"{hour_min}{ampm}"
+
+        # Clean up title - remove common suffixes
+        title = TICKETS_SUFFIX_RE.sub('', title)
+        title = BEBOP_SUFFIX_RE.sub('', title)
+        title = AT_BEBOP_SUFFIX_RE.sub('', title)
+
+        bands = self._split_bands(title)
+        if not bands:
+            bands = [title]
+
+        return Concert(
+            date=date,
+            venue_id="bebop",
+            venue_name="The Bebop",
+            venue_location="Boston",
+            bands=bands,
+            age_requirement="21+",
+            price_advance=None,
+            price_door=None,
+            time=time_str,
+            flags=[],
+            source=self.source_name,
+            source_url=BEBOP_URL,
+            genre_tags=["jazz", "soul", "funk"]
+        )
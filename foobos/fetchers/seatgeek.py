@@ -2,8 +2,10 @@
 SeatGeek API fetcher for concert events.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional
+import functools
 import logging
 
 from ..config import (
@@ -15,11 +17,87 @@ from ..config import (
     WEEKS_AHEAD,
 )
 from ..models import Concert
-from ..utils import get_cached, save_cache
+from ..utils import get_cached_pickle, save_cache_pickle
 from .base import BaseFetcher
 
 logger = logging.getLogger(__name__)
 
+# Cap at 10 pages (1000 events)
+MAX_PAGES = 10
+# Pages after the first are requested concurrently; kept low for the API's rate limit
+PAGE_FETCH_WORKERS = 4
+
+# Distinct venues remembered by _get_venue_id across fetches
+VENUE_ID_CACHE_SIZE = 512
+
+# Punctuation dropped from venue names when slugifying
+SLUG_PUNCTUATION = str.maketrans("", "", "'.,")
+
+# Common SeatGeek venue mappings (SeatGeek name slug -> our venue_id)
+SEATGEEK_VENUE_MAP = {
+    # Major Boston venues
+    "house-of-blues-boston": "hob_boston",
+    "citizens-house-of-blues-boston": "hob_boston",
+    "paradise-rock-club": "paradise",
+    "royale-boston": "royale",
+    "royale---boston": "royale",
+    "the-sinclair": "sinclair",
+    "the-sinclair---cambridge": "sinclair",
+    "brighton-music-hall": "brighton",
+    "middle-east-cambridge": "middleeast",
+    "middle-east---upstairs": "middleeast_up",
+    "middle-east-downstairs": "middleeast_down",
+    "middle-east---downstairs": "middleeast_down",
+    "orpheum-theatre-boston": "orpheum",
+    "orpheum-theatre---boston": "orpheum",
+    "roadrunner-boston": "roadrunner",
+    "roadrunner---boston": "roadrunner",
+    "td-garden": "tdgarden",
+    "fenway-park": "fenway",
+    "blue-hills-bank-pavilion": "pavilion",
+    "leader-bank-pavilion": "pavilion",
+    "xfinity-center-mansfield": "xfinity",
+    "wang-theatre": "wang",
+    "boch-center-wang-theatre": "wang",
+    # Additional venues from SeatGeek
+    "mgm-music-hall-at-fenway": "mgm_music_hall",
+    "big-night-live": "big_night_live",
+    "somerville-theatre": "somerville_theatre",
+    "city-winery---boston": "city_winery",
+    "city-winery-boston": "city_winery",
+    "blue-ocean-music-hall": "blue_ocean",
+    "the-cabot": "the_cabot",
+    "groton-hill-music-center": "groton_hill",
+    "the-grand---boston": "the_grand",
+    "the-grand-boston": "the_grand",
+    "chevalier-theatre": "chevalier",
+    "the-palladium": "palladium",
+    "boston-symphony-hall": "symphony_hall",
+    "berklee-performance-center": "berklee",
+    "cafe-939-at-berklee": "cafe_939",
+    "regattabar": "regattabar",
+    "scullers-jazz-club": "scullers",
+    # Additional Boston-area venues
+    "agganis-arena": "agganis",
+    "the-wilbur": "wilbur",
+    "wilbur-theatre": "wilbur",
+    "gillette-stadium": "gillette",
+    "club-passim": "clubpassim",
+    "sonia": "sonia",
+    "sonia-cambridge": "sonia",
+    "crystal-ballroom-somerville": "crystal_ballroom",
+    "crystal-ballroom---somerville": "crystal_ballroom",
+    "hampton-beach-casino-ballroom": "hampton_beach",
+    "indian-ranch-amphitheatre": "indian_ranch",
+    "indian-ranch": "indian_ranch",
+    "boch-center-shubert-theatre": "shubert",
+    "shubert-theatre": "shubert",
+    "emerson-colonial-theatre": "colonial",
+    "colonial-theatre": "colonial",
+    "tsongas-center": "tsongas",
+    "tsongas-center-at-umass-lowell": "tsongas",
+}
+
 
 class SeatGeekFetcher(BaseFetcher):
     """Fetch concerts from SeatGeek API."""
@@ -42,10 +120,10 @@ class SeatGeekFetcher(BaseFetcher):
             return []
 
         # Check cache first
-        cached = get_cached("seatgeek_boston")
+        cached = get_cached_pickle("seatgeek_boston")
         if cached:
             logger.info(f"[{self.source_name}] Using cached data ({len(cached)} events)")
-            return [Concert.from_dict(c) for c in cached]
+            return cached
 
         concerts = []
         try:
@@ -56,7 +134,7 @@ class SeatGeekFetcher(BaseFetcher):
                     concerts.append(concert)
 
             # Cache the results
-            save_cache("seatgeek_boston", [c.to_dict() for c in concerts])
+            save_cache_pickle("seatgeek_boston", concerts)
             self._log_fetch_complete(len(concerts))
 
         except Exception as e:
@@ -89,37 +167,48 @@ class SeatGeekFetcher(BaseFetcher):
         if SEATGEEK_CLIENT_SECRET:
             params["client_secret"] = SEATGEEK_CLIENT_SECRET
 
-        page = 1
-        total_pages = 1
-
-        while page <= total_pages and page <= 10:  # Cap at 10 pages (1000 events)
-            params["page"] = page
-
-            try:
-                response = self._make_request(
-                    f"{SEATGEEK_BASE_URL}/events",
-                    params=params
-                )
-                data = response.json()
-
-                if "events" in data:
-                    all_events.extend(data["events"])
-
-                # Get pagination info
-                meta = data.get("meta", {})
-                total = meta.get("total", 0)
-                per_page = meta.get("per_page", 100)
-                if total > 0 and per_page > 0:
-                    total_pages = min((total // per_page) + 1, 10)
+        # First page tells us how many pages there are
+        try:
+            data = self._fetch_page(params, 1)
+        except Exception as e:
+            logger.error(f"Error fetching SeatGeek page 1: {e}")
+            return all_events
 
-                page += 1
+        all_events.extend(data.get("events", []))
 
-            except Exception as e:
-                logger.error(f"Error fetching SeatGeek page {page}: {e}")
-                break
+        # Get pagination info
+        total_pages = 1
+        meta = data.get("meta", {})
+        total = meta.get("total", 0)
+        per_page = meta.get("per_page", 100)
+        if total > 0 and per_page > 0:
+            total_pages = min((total // per_page) + 1, MAX_PAGES)
+
+        if total_pages < 2:
+            return all_events
+
+        # Fetch the remaining pages concurrently, keeping events in page order
+        pages = range(2, total_pages + 1)
+        with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(pages))) as pool:
+            futures = [pool.submit(self._fetch_page, params, page) for page in pages]
+            for page, future in zip(pages, futures):
+                try:
+                    data = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching SeatGeek page {page}: {e}")
+                    break
+                all_events.extend(data.get("events", []))
 
         return all_events
 
+    def _fetch_page(self, params: dict, page: int) -> dict:
+        """Fetch one page of SeatGeek events."""
+        response = self._make_request(
+            f"{SEATGEEK_BASE_URL}/events",
+            params={**params, "page": page}
+        )
+        return self._decode_json(response)
+
     def _parse_event(self, event: dict) -> Optional[Concert]:
         """Parse SeatGeek event into Concert object."""
         try:
@@ -129,21 +218,25 @@ class SeatGeekFetcher(BaseFetcher):
             if not datetime_local:
                 return None
 
-            # Parse datetime from local time
+            # Parse datetime from local time (ISO "YYYY-MM-DDTHH:MM:SS"), and
+            # take the show time (e.g. "8pm") from the same parse
+            time = "8pm"
+            hour = None
             try:
-                date = datetime.strptime(datetime_local[:19], "%Y-%m-%dT%H:%M:%S")
+                date = datetime.fromisoformat(datetime_local[:19])
+                if "T" in datetime_local:
+                    hour = date.hour
             except ValueError:
-                date = datetime.strptime(datetime_local[:10], "%Y-%m-%d")
-
-            # Extract time from local datetime
-            time = "8pm"
-            if datetime_local and "T" in datetime_local:
-                try:
-                    time_part = datetime_local.split("T")[1][:5]
-                    time_obj = datetime.strptime(time_part, "%H:%M")
-                    time = time_obj.strftime("%-I%p").lower()
-                except (ValueError, IndexError):
-                    pass
+                date = datetime.fromisoformat(datetime_local[:10])
+                # The full timestamp is malformed, but its "HH:MM" part may be fine
+                if "T" in datetime_local:
+                    try:
+                        time_part = datetime_local.split("T")[1][:5]
+                        hour = datetime.strptime(time_part, "%H:%M").hour
+                    except (ValueError, IndexError):
+                        pass
+            if hour is not None:
+                time = f"{hour % 12 or 12}{'am' if hour < 12 else 'pm'}"
 
             # Extract venue
             venue_data = event.get("venue", {})
@@ -153,13 +246,22 @@ class SeatGeekFetcher(BaseFetcher):
             venue_city = venue_data.get("city", "Boston")
             venue_id = self._get_venue_id(venue_data.get("id", ""), venue_name)
 
-            # Extract bands/performers
+            # Extract bands and their genres in one pass over the performers
             performers = event.get("performers", [])
             bands = []
+            seen_bands = set()
+            genre_tags = []
+            seen_genres = set()
             for p in performers:
                 name = p.get("name", "")
-                if name and name not in bands:
+                if name and name not in seen_bands:
+                    seen_bands.add(name)
                     bands.append(name)
+                for g in p.get("genres", []):
+                    genre_name = g.get("name", "").lower()
+                    if genre_name and genre_name not in seen_genres:
+                        seen_genres.add(genre_name)
+                        genre_tags.append(genre_name)
 
             if not bands:
                 # Use event title as fallback
@@ -180,15 +282,6 @@ class SeatGeekFetcher(BaseFetcher):
             if highest:
                 price_door = int(highest)
 
-            # Extract genres from performers
-            genre_tags = []
-            for p in performers:
-                genres = p.get("genres", [])
-                for g in genres:
-                    genre_name = g.get("name", "").lower()
-                    if genre_name and genre_name not in genre_tags:
-                        genre_tags.append(genre_name)
-
             # Determine age requirement
             age_req = "18+"  # Default for most concerts
 
@@ -215,90 +308,21 @@ class SeatGeekFetcher(BaseFetcher):
             logger.debug(f"Error parsing SeatGeek event: {e}")
             return None
 
-    def _get_venue_id(self, sg_venue_id: str, venue_name: str) -> str:
-        """Map SeatGeek venue to our venue slug."""
-        # Common SeatGeek venue mappings (SeatGeek name slug -> our venue_id)
-        sg_venue_map = {
-            # Major Boston venues
-            "house-of-blues-boston": "hob_boston",
-            "citizens-house-of-blues-boston": "hob_boston",
-            "paradise-rock-club": "paradise",
-            "royale-boston": "royale",
-            "royale---boston": "royale",
-            "the-sinclair": "sinclair",
-            "the-sinclair---cambridge": "sinclair",
-            "brighton-music-hall": "brighton",
-            "middle-east-cambridge": "middleeast",
-            "middle-east---upstairs": "middleeast_up",
-            "middle-east-downstairs": "middleeast_down",
-            "middle-east---downstairs": "middleeast_down",
-            "orpheum-theatre-boston": "orpheum",
-            "orpheum-theatre---boston": "orpheum",
-            "roadrunner-boston": "roadrunner",
-            "roadrunner---boston": "roadrunner",
-            "td-garden": "tdgarden",
-            "fenway-park": "fenway",
-            "blue-hills-bank-pavilion": "pavilion",
-            "leader-bank-pavilion": "pavilion",
-            "xfinity-center-mansfield": "xfinity",
-            "wang-theatre": "wang",
-            "boch-center-wang-theatre": "wang",
-            # Additional venues from SeatGeek
-            "mgm-music-hall-at-fenway": "mgm_music_hall",
-            "big-night-live": "big_night_live",
-            "somerville-theatre": "somerville_theatre",
-            "city-winery---boston": "city_winery",
-            "city-winery-boston": "city_winery",
-            "blue-ocean-music-hall": "blue_ocean",
-            "the-cabot": "the_cabot",
-            "groton-hill-music-center": "groton_hill",
-            "the-grand---boston": "the_grand",
-            "the-grand-boston": "the_grand",
-            "chevalier-theatre": "chevalier",
-            "the-palladium": "palladium",
-            "boston-symphony-hall": "symphony_hall",
-            "berklee-performance-center": "berklee",
-            "cafe-939-at-berklee": "cafe_939",
-            "regattabar": "regattabar",
-            "scullers-jazz-club": "scullers",
-            # Additional Boston-area venues
-            "agganis-arena": "agganis",
-            "the-wilbur": "wilbur",
-            "wilbur-theatre": "wilbur",
-            "gillette-stadium": "gillette",
-            "club-passim": "clubpassim",
-            "sonia": "sonia",
-            "sonia-cambridge": "sonia",
-            "crystal-ballroom-somerville": "crystal_ballroom",
-            "crystal-ballroom---somerville": "crystal_ballroom",
-            "hampton-beach-casino-ballroom": "hampton_beach",
-            "indian-ranch-amphitheatre": "indian_ranch",
-            "indian-ranch": "indian_ranch",
-            "boch-center-shubert-theatre": "shubert",
-            "shubert-theatre": "shubert",
-            "emerson-colonial-theatre": "colonial",
-            "colonial-theatre": "colonial",
-            "tsongas-center": "tsongas",
-            "tsongas-center-at-umass-lowell": "tsongas",
-        }
+    @staticmethod
+    @functools.lru_cache(maxsize=VENUE_ID_CACHE_SIZE)
+    def _get_venue_id(sg_venue_id: str, venue_name: str) -> str:
+        """Map SeatGeek venue to our venue slug (memoized; depends only on its arguments)."""
+        if not venue_name:
+            return "unknown"
 
         # Try slug from venue name
-        if venue_name:
-            slug = venue_name.lower()
-            slug = slug.replace("'", "").replace(".", "").replace(",", "").replace(" - ", "-")
-            slug = "-".join(slug.split())
-
-            if slug in sg_venue_map:
-                return sg_venue_map[slug]
+        name = venue_name.lower().translate(SLUG_PUNCTUATION)
+        venue_id = SEATGEEK_VENUE_MAP.get("-".join(name.replace(" - ", "-").split()))
+        if venue_id:
+            return venue_id
 
         # Fall back to slugifying the venue name
-        if venue_name:
-            slug = venue_name.lower()
-            slug = slug.replace("'", "").replace(".", "").replace(",", "")
-            slug = "_".join(slug.split())
-            return slug[:30]
-
-        return "unknown"
+        return "_".join(name.split())[:30]
 
     def _get_flags(self, event: dict) -> List[str]:
         """Determine event flags."""
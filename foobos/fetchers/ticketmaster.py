@@ -2,8 +2,10 @@
 Ticketmaster Discovery API fetcher.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import List, Optional, Tuple
+import functools
 import logging
 
 from ..config import (
@@ -13,11 +15,37 @@ from ..config import (
     VENUE_TICKETMASTER_IDS
 )
 from ..models import Concert
-from ..utils import get_cached, save_cache
+from ..utils import get_cached, save_cache, config_cache_key
 from .base import BaseFetcher
 
 logger = logging.getLogger(__name__)
 
+# Cap at 10 pages (2000 events)
+MAX_PAGES = 10
+# Pages after the first are requested concurrently; kept under the API's 5 requests/second
+PAGE_FETCH_WORKERS = 4
+
+# Reverse of VENUE_TICKETMASTER_IDS (Ticketmaster venue ID -> our venue slug);
+# built from the end so the first mapping wins if an ID is listed twice
+TICKETMASTER_VENUE_IDS = {tm_id: our_id for our_id, tm_id in reversed(VENUE_TICKETMASTER_IDS.items())}
+
+# Punctuation dropped from venue names when slugifying
+SLUG_PUNCTUATION = str.maketrans("", "", "'.,")
+
+# Distinct venues remembered by _get_venue_id across fetches
+VENUE_ID_CACHE_SIZE = 512
+
+# Display label for each localTime hour ("19" -> "7pm"), with and without zero padding
+HOUR_LABELS = {
+    key: f"{hour % 12 or 12}{'am' if hour < 12 else 'pm'}"
+    for hour in range(24)
+    for key in (f"{hour:02d}", str(hour))
+}
+
+# Each result page is revalidated with a conditional GET; its events are kept
+# for a day (the query's date range, and so the cache key, changes daily)
+PAGE_CACHE_TTL_HOURS = 24
+
 
 class TicketmasterFetcher(BaseFetcher):
     """Fetch concerts from Ticketmaster Discovery API."""
@@ -84,33 +112,62 @@ class TicketmasterFetcher(BaseFetcher):
             "sort": "date,asc"
         }
 
-        page = 0
-        total_pages = 1
+        # First page tells us how many pages there are
+        try:
+            events, page_count = self._fetch_page({**params, "page": 0})
+        except Exception as e:
+            logger.error(f"Error fetching page 0: {e}")
+            return all_events
+
+        all_events.extend(events)
+
+        # Get pagination info
+        total_pages = min(page_count, MAX_PAGES) if page_count is not None else 1
+        if total_pages < 2:
+            return all_events
+
+        # Fetch the remaining pages concurrently, keeping events in page order
+        pages = range(1, total_pages)
+        with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(pages))) as pool:
+            futures = [pool.submit(self._fetch_page, {**params, "page": page}) for page in pages]
+            for page, future in zip(pages, futures):
+                try:
+                    events, _ = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching page {page}: {e}")
+                    break
+                all_events.extend(events)
 
-        while page < total_pages and page < 10:  # Cap at 10 pages (2000 events)
-            params["page"] = page
+        return all_events
 
-            try:
-                response = self._make_request(
-                    f"{TICKETMASTER_BASE_URL}/events.json",
-                    params=params
-                )
-                data = response.json()
+    def _fetch_page(self, params: dict) -> Tuple[List[dict], Optional[int]]:
+        """
+        Fetch one page of events, revalidating a previously cached copy.
 
-                if "_embedded" in data and "events" in data["_embedded"]:
-                    all_events.extend(data["_embedded"]["events"])
+        Returns:
+            (events, total_pages) - total_pages is None if the response has no
+            pagination info
+        """
+        page_key = config_cache_key("ticketmaster_page", sorted(params.items()))
+        cached = get_cached(page_key, ttl_hours=PAGE_CACHE_TTL_HOURS)
 
-                # Get pagination info
-                if "page" in data:
-                    total_pages = min(data["page"].get("totalPages", 1), 10)
+        response, validators = self._make_conditional_request(
+            f"{TICKETMASTER_BASE_URL}/events.json",
+            cached and cached["validators"],
+            params=params
+        )
+        if response is None:
+            logger.debug(f"[{self.source_name}] Page {params['page']} unchanged, reusing cached events")
+            return cached["events"], cached["total_pages"]
 
-                page += 1
+        data = self._decode_json(response)
+        events = data.get("_embedded", {}).get("events", [])
+        total_pages = data["page"].get("totalPages", 1) if "page" in data else None
 
-            except Exception as e:
-                logger.error(f"Error fetching page {page}: {e}")
-                break
+        if any(validators.values()):
+            save_cache(page_key, {"validators": validators, "events": events, "total_pages": total_pages})
 
-        return all_events
+        return events, total_pages
 
     def _parse_event(self, event: dict) -> Optional[Concert]:
         """Parse Ticketmaster event into Concert object."""
@@ -127,18 +184,15 @@ class TicketmasterFetcher(BaseFetcher):
             date_str = start.get("localDate")
             if not date_str:
                 return None
-            date = datetime.strptime(date_str, "%Y-%m-%d")
+            date = datetime.fromisoformat(date_str)
 
-            # Extract time
+            # Extract time ("19:30:00" -> "7pm")
             time_str = start.get("localTime", "20:00:00")
-            try:
-                time_obj = datetime.strptime(time_str, "%H:%M:%S")
-                time = time_obj.strftime("%-I%p").lower()  # "8pm"
-            except ValueError:
-                time = "8pm"
+            time = HOUR_LABELS.get(time_str.partition(":")[0], "8pm")
 
             # Extract venue
-            venues = event.get("_embedded", {}).get("venues", [])
+            embedded = event.get("_embedded", {})
+            venues = embedded.get("venues", [])
             if not venues:
                 return None
             venue_data = venues[0]
@@ -147,7 +201,7 @@ class TicketmasterFetcher(BaseFetcher):
             venue_id = self._get_venue_id(venue_data.get("id", ""), venue_name)
 
             # Extract bands/artists
-            attractions = event.get("_embedded", {}).get("attractions", [])
+            attractions = embedded.get("attractions", [])
             bands = [a.get("name", "") for a in attractions if a.get("name")]
             if not bands:
                 bands = [event.get("name", "Unknown Artist")]
@@ -161,13 +215,12 @@ class TicketmasterFetcher(BaseFetcher):
                 price_door = int(price_ranges[0].get("max", 0))
 
             # Extract genres
-            genre_tags = []
-            classifications = event.get("classifications", [])
-            for c in classifications:
-                if c.get("genre", {}).get("name"):
-                    genre_tags.append(c["genre"]["name"].lower())
-                if c.get("subGenre", {}).get("name"):
-                    genre_tags.append(c["subGenre"]["name"].lower())
+            genre_tags = [
+                name.lower()
+                for c in event.get("classifications", [])
+                for key in ("genre", "subGenre")
+                if (name := (c.get(key) or {}).get("name"))
+            ]
 
             # Determine age requirement (default to 18+ for most venues)
             age_req = self._get_age_requirement(event)
@@ -195,17 +248,17 @@ class TicketmasterFetcher(BaseFetcher):
             logger.debug(f"Error parsing event: {e}")
             return None
 
-    def _get_venue_id(self, tm_venue_id: str, venue_name: str) -> str:
-        """Map Ticketmaster venue ID to our venue slug."""
+    @staticmethod
+    @functools.lru_cache(maxsize=VENUE_ID_CACHE_SIZE)
+    def _get_venue_id(tm_venue_id: str, venue_name: str) -> str:
+        """Map Ticketmaster venue ID to our venue slug (memoized; depends only on its arguments)."""
         # Check if we have a mapping for this Ticketmaster ID
-        for our_id, tm_id in VENUE_TICKETMASTER_IDS.items():
-            if tm_id == tm_venue_id:
-                return our_id
+        our_id = TICKETMASTER_VENUE_IDS.get(tm_venue_id)
+        if our_id:
+            return our_id
 
         # Fall back to slugifying the venue name
-        slug = venue_name.lower()
-        slug = slug.replace("'", "").replace(".", "").replace(",", "")
-        slug = "_".join(slug.split())
+        slug = "_".join(venue_name.lower().translate(SLUG_PUNCTUATION).split())
         return slug[:30]
 
     def _get_age_requirement(self, event: dict) -> str:
@@ -4,17 +4,23 @@ Matches foopee.com format: band header with bulleted shows underneath.
 """
 
 from html import escape
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
 import logging
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from operator import attrgetter
 
 from ..models import Concert
 from ..config import OUTPUT_DIR, SITE_URL
-from .helpers import html_header, html_footer
+from .helpers import (
+    EVENT_LINK, html_header, html_footer, write_page, _band_to_anchor, _venue_to_anchor
+)
 
 logger = logging.getLogger(__name__)
 
+# One concert line: date, venue anchor, venue, details, flags tail, event link tail
+CONCERT_LINE = '<li><b>%s</b> <a href="by-club.html#%s">%s</a> %s%s%s</li>\n'
+
 
 def _normalize_band_key(band: str) -> str:
     """Normalize band name for grouping (case-insensitive, no punctuation)."""
@@ -30,69 +36,78 @@ def generate_by_band_pages(concerts: List[Concert]) -> Tuple[int, Dict[str, Tupl
         Tuple of (page_count, band_info_dict)
         band_info_dict maps band_name -> (anchor, page_num) where page_num is always 0
     """
+    # Count each display-name variant per normalized key, in input order so
+    # ties go to the variant seen first in the input (not the earliest date)
+    name_counts: Counter = Counter()
+    band_keys: Dict[str, str] = {}
+    for concert in concerts:
+        for band in concert.bands:
+            if band and len(band) > 1:  # Skip single characters
+                key = band_keys.get(band)
+                if key is None:
+                    key = band_keys[band] = _normalize_band_key(band)
+                name_counts[(key, band)] += 1
+
+    # Sort once (stable) so every band's list is built in date order
+    concerts = sorted(concerts, key=attrgetter("date"))
+
     # Group concerts by normalized band key for deduplication
     by_band_key: Dict[str, List[Concert]] = defaultdict(list)
-    # Track the preferred display name for each normalized key (most common or first seen)
-    band_display_names: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
-
     for concert in concerts:
         for band in concert.bands:
-            if band and len(band) > 1:  # Skip single characters
-                key = _normalize_band_key(band)
-                by_band_key[key].append(concert)
-                band_display_names[key][band] += 1
+            if band and len(band) > 1:
+                by_band_key[band_keys[band]].append(concert)
+
+    # Preferred display name for each key: the most common variant, first seen on ties
+    best_names: Dict[str, Tuple[str, int]] = {}
+    for (key, band), count in name_counts.items():
+        if count > best_names.get(key, ("", 0))[1]:
+            best_names[key] = (band, count)
 
-    # Convert to display name keyed dict, using most frequent name variant
+    # Convert to display name keyed dict, using most frequent name variant,
+    # and compute each band's anchor once for both the page and the index links
     by_band: Dict[str, List[Concert]] = {}
-    key_to_display: Dict[str, str] = {}
+    anchors: Dict[str, str] = {}
+    band_info: Dict[str, Tuple[str, int]] = {}
     for key, concerts_list in by_band_key.items():
-        # Choose the most common display name
-        display_name = max(band_display_names[key].items(), key=lambda x: x[1])[0]
+        display_name = best_names[key][0]
         by_band[display_name] = concerts_list
-        key_to_display[key] = display_name
 
-    # Build band_info for index page links
-    band_info: Dict[str, Tuple[str, int]] = {}
-    for band in by_band.keys():
-        anchor = _band_to_anchor(band)
-        band_info[band] = (anchor, 0)  # All bands on page 0 now
+        anchor = _band_to_anchor(display_name)
+        anchors[display_name] = anchor
+        band_info[display_name] = (anchor, 0)  # All bands on page 0 now
 
     # Generate single page with all bands
-    _generate_band_page(by_band)
+    _generate_band_page(by_band, anchors)
 
     logger.info(f"Generated 1 by-band page with {len(by_band)} bands")
 
     return 1, band_info
 
 
-def _band_to_anchor(band: str) -> str:
-    """Convert band name to HTML anchor."""
-    anchor = band.lower()
-    anchor = anchor.replace(" ", "_").replace("'", "").replace(".", "").replace(",", "")
-    anchor = anchor.replace("&", "and").replace("$", "s")
-    # Remove other special characters
-    anchor = ''.join(c for c in anchor if c.isalnum() or c == '_')
-    return anchor[:40]
+def _generate_band_page(bands: Dict[str, List[Concert]], anchors: Dict[str, str]) -> None:
+    """Generate the single by-band.html page in foopee format.
 
-
-def _venue_to_anchor(venue_id: str) -> str:
-    """Convert venue ID to HTML anchor (must match by_club_generator)."""
-    anchor = venue_id.lower()
-    anchor = anchor.replace(" ", "_").replace("'", "").replace(".", "").replace(",", "")
-    return anchor[:30]
+    Args:
+        bands: Concerts keyed by band display name, each list in date order
+        anchors: Precomputed _band_to_anchor value for each band
+    """
+    # Join once; write_page encodes it once and writes the bytes in one call
+    output_path = Path(OUTPUT_DIR) / "by-band.html"
+    write_page(output_path, "".join(_band_page_fragments(bands, anchors)))
 
 
-def _generate_band_page(bands: Dict[str, List[Concert]]) -> None:
-    """Generate the single by-band.html page in foopee format."""
+def _band_page_fragments(bands: Dict[str, List[Concert]], anchors: Dict[str, str]) -> Iterator[str]:
+    """Yield the by-band page's HTML in order, one fragment at a time."""
     band_count = len(bands)
     description = f"All {band_count} bands with upcoming Boston area concerts."
 
-    html = html_header(
+    yield html_header(
         title="Listing By Band",
         description=description,
         canonical_url=f"{SITE_URL}/by-band.html"
     )
-    html += '''
+    yield '''
 <h2><i>Listing By Band</i></h2>
 
 <p><a href="list.html">Back to The List</a></p>
@@ -101,67 +116,54 @@ def _generate_band_page(bands: Dict[str, List[Concert]]) -> None:
 
 '''
 
-    for band, concerts in sorted(bands.items(), key=lambda x: x[0].lower()):
+    # Concerts share a few hundred distinct dates; format each one once
+    date_labels = {
+        d: d.strftime("%b %-d")
+        for d in {c.date for band_concerts in bands.values() for c in band_concerts}
+    }
+
+    details_cache: Dict[str, str] = {}
+    flags_cache: Dict[str, str] = {}
+
+    # Sort the names with str.lower as a C-level key instead of a lambda over items
+    for band in sorted(bands, key=str.lower):
+        concerts = bands[band]
         if not concerts:
             continue
 
-        anchor = _band_to_anchor(band)
+        anchor = anchors[band]
         # Escape band name to prevent XSS
         band_escaped = escape(band)
 
-        # Sort concerts by date
-        concerts = sorted(concerts, key=lambda c: c.date)
-
         # Band header (bold) with anchor
-        html += f'<ul>\n'
-        html += f'<li><a name="{anchor}"><b>{band_escaped}</b></a>\n'
-        html += '<ul>\n'
+        yield f'<ul>\n<li><a name="{anchor}"><b>{band_escaped}</b></a>\n<ul>\n'
 
         for concert in concerts:
-            date_str = concert.date.strftime("%b %-d")
+            date_str = date_labels[concert.date]
             # Escape venue info and create link with anchor
             venue_str = f"{escape(concert.venue_name)}, {escape(concert.venue_location)}"
             venue_anchor = _venue_to_anchor(concert.venue_id)
 
-            # Build details string - escape all scraped data
-            details_parts = []
-            if concert.age_requirement and concert.age_requirement != "a/a":
-                details_parts.append(escape(concert.age_requirement))
-            else:
-                details_parts.append("a/a")
+            # Recurring events repeat the same details and flags, so escape
+            # each distinct string once - escape to prevent XSS
+            details = details_cache.get(concert.details_display)
+            if details is None:
+                details = details_cache[concert.details_display] = escape(concert.details_display)
 
-            if concert.price_display:
-                details_parts.append(escape(concert.price_display))
+            flags_tail = flags_cache.get(concert.flags_display)
+            if flags_tail is None:
+                flags_str = concert.flags_display
+                flags_tail = flags_cache[flags_str] = " " + escape(flags_str) if flags_str else ""
 
-            if concert.time:
-                details_parts.append(escape(concert.time))
+            link_tail = EVENT_LINK % escape(concert.source_url) if concert.source_url else ""
 
-            details = " ".join(details_parts)
+            yield CONCERT_LINE % (date_str, venue_anchor, venue_str, details, flags_tail, link_tail)
 
-            # Add flags - escape to prevent XSS
-            flags_str = " ".join(escape(flag) for flag in concert.flags) if concert.flags else ""
+        yield '</ul>\n</li>\n</ul>\n\n'
 
-            line = f'<li><b>{date_str}</b> <a href="by-club.html#{venue_anchor}">{venue_str}</a> {details}'
-            if flags_str:
-                line += f" {flags_str}"
-            # Event link - subtle arrow to source/ticket page
-            if concert.source_url:
-                line += f'&nbsp;<a href="{escape(concert.source_url)}" title="Event info" style="text-decoration:none;padding:8px 12px;margin:-8px -4px">→</a>'
-            line += '</li>\n'
-
-            html += line
-
-        html += '</ul>\n'
-        html += '</li>\n'
-        html += '</ul>\n\n'
-
-    html += '''<hr>
+    yield '''<hr>
 
 <p><a href="list.html">Back to The List</a></p>
 
 '''
-    html += html_footer()
-
-    output_path = Path(OUTPUT_DIR) / "by-band.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    yield html_footer()
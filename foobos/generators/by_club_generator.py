@@ -4,17 +4,43 @@ Matches foopee.com format: venue header with bulleted shows underneath.
 """
 
 from html import escape
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Tuple
+import functools
 import logging
 from pathlib import Path
 from collections import defaultdict
+from operator import attrgetter, itemgetter
 
 from ..models import Concert
 from ..config import OUTPUT_DIR, SITE_URL
-from .helpers import html_header, html_footer
+from .helpers import (
+    EVENT_LINK, html_header, html_footer, write_page, _band_to_anchor, _venue_to_anchor
+)
 
 logger = logging.getLogger(__name__)
 
+# Static page sections around the venue list
+CLUB_PAGE_INTRO = '''
+<h2><i>Listing By Club</i></h2>
+
+<p><a href="list.html">Back to The List</a></p>
+
+<hr>
+
+'''
+CLUB_PAGE_CLOSING = '''<hr>
+
+<p><a href="list.html">Back to The List</a></p>
+
+'''
+
+# Page markup, built once: venue header (anchor, name, location), one concert
+# line (date, band links, details, flags tail, event link tail), venue footer
+VENUE_HEADER = '<ul>\n<li><a name="%s"><b>%s, %s</b></a>\n<ul>\n'
+CONCERT_LINE = '<li><b>%s</b> %s %s%s%s</li>\n'
+VENUE_FOOTER = '</ul>\n</li>\n</ul>\n\n'
+BAND_LINK = '<a href="by-band.html#%s">%s</a>'
+
 
 def generate_by_club_pages(concerts: List[Concert]) -> Tuple[int, Dict[str, Tuple[str, str, int]]]:
     """Generate the single by-club.html page.
@@ -29,6 +55,10 @@ def generate_by_club_pages(concerts: List[Concert]) -> Tuple[int, Dict[str, Tupl
     for concert in concerts:
         by_venue[concert.venue_id].append(concert)
 
+    # Put each venue's shows in date order once, in place
+    for venue_concerts in by_venue.values():
+        venue_concerts.sort(key=attrgetter("date"))
+
     # Build venue_info for index page links
     venue_info: Dict[str, Tuple[str, str, int]] = {}
 
@@ -49,117 +79,80 @@ def generate_by_club_pages(concerts: List[Concert]) -> Tuple[int, Dict[str, Tupl
     return 1, venue_info
 
 
-def _venue_to_anchor(venue_id: str) -> str:
-    """Convert venue ID to HTML anchor."""
-    anchor = venue_id.lower()
-    anchor = anchor.replace(" ", "_").replace("'", "").replace(".", "").replace(",", "")
-    return anchor[:30]
+@functools.lru_cache(maxsize=None)
+def _band_link(band: str) -> str:
+    """Render a band's link to its by-band anchor - escape scraped names."""
+    return BAND_LINK % (_band_to_anchor(band), escape(band))
 
 
-def _band_to_anchor(band: str) -> str:
-    """Convert band name to HTML anchor (must match by_band_generator)."""
-    anchor = band.lower()
-    anchor = anchor.replace(" ", "_").replace("'", "").replace(".", "").replace(",", "")
-    anchor = anchor.replace("&", "and").replace("$", "s")
-    anchor = ''.join(c for c in anchor if c.isalnum() or c == '_')
-    return anchor[:40]
+def _venue_sort_name(name: str) -> str:
+    """Case-folded venue name for sorting, ignoring a leading "The"."""
+    folded = name.casefold()
+    return folded[4:] if folded.startswith("the ") else folded
 
 
 def _generate_club_page(venues: Dict[str, List[Concert]]) -> None:
-    """Generate the single by-club.html page in foopee format."""
+    """Generate the single by-club.html page in foopee format.
+
+    Each venue's concerts must already be in date order.
+    """
+    output_path = Path(OUTPUT_DIR) / "by-club.html"
+    write_page(output_path, "".join(_club_page_fragments(venues)))
+
+
+def _club_page_fragments(venues: Dict[str, List[Concert]]) -> Iterator[str]:
+    """Yield the by-club page's HTML in order, one fragment at a time."""
     venue_count = len([v for v in venues.values() if v])
     description = f"All {venue_count} venues hosting live music in the Boston area."
 
-    html = html_header(
+    yield html_header(
         title="Listing By Club",
         description=description,
         canonical_url=f"{SITE_URL}/by-club.html"
     )
-    html += '''
-<h2><i>Listing By Club</i></h2>
-
-<p><a href="list.html">Back to The List</a></p>
-
-<hr>
-
-'''
-
-    # Sort venues by display name (handling "The" prefix)
-    def sort_key(item):
-        venue_id, concerts = item
-        if not concerts:
-            return venue_id.lower()
-        name = concerts[0].venue_name
-        if name.lower().startswith("the "):
-            return name[4:].lower()
-        return name.lower()
-
-    for venue_id, concerts in sorted(venues.items(), key=sort_key):
-        if not concerts:
-            continue
-
+    yield CLUB_PAGE_INTRO
+
+    # Concerts share a few hundred distinct dates; format each one once
+    date_labels = {
+        d: d.strftime("%b %-d")
+        for d in {c.date for venue_concerts in venues.values() for c in venue_concerts}
+    }
+
+    # Sort venues by display name (handling "The" prefix); each sort name is
+    # computed once and the stable sort keys on it with a C-level itemgetter
+    decorated = [
+        (_venue_sort_name(concerts[0].venue_name), venue_id, concerts)
+        for venue_id, concerts in venues.items()
+        if concerts
+    ]
+    decorated.sort(key=itemgetter(0))
+
+    for _, venue_id, concerts in decorated:
         # Get venue display name from first concert - escape for XSS prevention
-        venue_name = escape(concerts[0].venue_name)
-        venue_location = escape(concerts[0].venue_location)
+        first = concerts[0]
+        venue_name = escape(first.venue_name)
+        venue_location = escape(first.venue_location)
         anchor = _venue_to_anchor(venue_id)
 
-        # Sort concerts by date
-        concerts = sorted(concerts, key=lambda c: c.date)
-
         # Venue header (bold)
-        html += f'<ul>\n'
-        html += f'<li><a name="{anchor}"><b>{venue_name}, {venue_location}</b></a>\n'
-        html += '<ul>\n'
+        yield VENUE_HEADER % (anchor, venue_name, venue_location)
 
         for concert in concerts:
-            date_str = concert.date.strftime("%b %-d")
+            date_str = date_labels[concert.date]
             # Create individual band links with anchors
-            band_links = []
-            for band in concert.bands:
-                band_escaped = escape(band)
-                band_anchor = _band_to_anchor(band)
-                band_links.append(f'<a href="by-band.html#{band_anchor}">{band_escaped}</a>')
-            bands_str = ", ".join(band_links)
-
-            # Build details string - escape all scraped data
-            details_parts = []
-            if concert.age_requirement and concert.age_requirement != "a/a":
-                details_parts.append(escape(concert.age_requirement))
-            else:
-                details_parts.append("a/a")
-
-            if concert.price_display:
-                details_parts.append(escape(concert.price_display))
-
-            if concert.time:
-                details_parts.append(escape(concert.time))
-
-            details = " ".join(details_parts)
-
-            # Add flags - escape to prevent XSS
-            flags_str = " ".join(escape(flag) for flag in concert.flags) if concert.flags else ""
-
-            line = f'<li><b>{date_str}</b> {bands_str} {details}'
-            if flags_str:
-                line += f" {flags_str}"
-            # Event link - subtle arrow to source/ticket page
-            if concert.source_url:
-                line += f'&nbsp;<a href="{escape(concert.source_url)}" title="Event info" style="text-decoration:none;padding:8px 12px;margin:-8px -4px">→</a>'
-            line += '</li>\n'
-
-            html += line
-
-        html += '</ul>\n'
-        html += '</li>\n'
-        html += '</ul>\n\n'
+            bands_str = ", ".join(_band_link(band) for band in concert.bands)
 
-    html += '''<hr>
+            # Details and flags - escape all scraped data
+            details = escape(concert.details_display)
+            flags = concert.flags_display
+            flags_tail = f" {escape(flags)}" if flags else ""
+            # Event link - subtle arrow to source/ticket page
+            source_url = concert.source_url
+            link_tail = EVENT_LINK % escape(source_url) if source_url else ""
 
-<p><a href="list.html">Back to The List</a></p>
+            yield CONCERT_LINE % (date_str, bands_str, details, flags_tail, link_tail)
 
-'''
-    html += html_footer()
+        yield VENUE_FOOTER
 
-    output_path = Path(OUTPUT_DIR) / "by-club.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    yield CLUB_PAGE_CLOSING
+    yield html_footer()
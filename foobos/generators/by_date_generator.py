@@ -2,100 +2,169 @@
 Generate by-date.X.html pages - concerts organized by week.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict
 import logging
+import re
 from pathlib import Path
 from collections import defaultdict
+from operator import attrgetter
 
 from ..models import Concert
 from ..config import OUTPUT_DIR, WEEKS_AHEAD, SITE_URL
 from ..utils.date_utils import get_week_range, get_week_label, get_week_number, get_adjusted_week_label
-from .helpers import format_concert_line, html_header, html_footer, is_livenation_venue, is_free_event
+from .helpers import format_concert_line, html_header, html_footer, is_livenation_venue, is_free_event, write_page
 
 logger = logging.getLogger(__name__)
 
+# Leading "7", "7:30", "7pm" or "7:30 pm" of a show time, for ordering a day's shows
+SORT_TIME_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?')
+
+# Static parts of every week page; the intro takes the week label. The
+# closing block (back links and the Ticketmaster-venue toggle script) follows
+# the per-page date shortcuts.
+WEEK_PAGE_INTRO = '''
+<p>[ <a href="list.html">Back</a> | <a href="mailto:sf@scottfriedman.ooo">Email Me</a> ]</p>
+
+<h2><i>Listing By Date</i></h2>
+
+<h3>%s</h3>
+
+<p><label><input type="checkbox" id="hide-ln" onchange="toggleLN()"> Hide Ticketmaster Venues</label></p>
+
+<ul>
+'''
+WEEK_PAGE_CLOSING = '''<p>[ <a href="list.html">Back</a> | <a href="mailto:sf@scottfriedman.ooo">Email Me</a> ]</p>
+
+<script>
+function toggleLN() {
+  var hide = document.getElementById('hide-ln').checked;
+  sessionStorage.setItem('hideLN', hide ? 'true' : 'false');
+  applyLNFilter();
+}
+
+function applyLNFilter() {
+  var hide = sessionStorage.getItem('hideLN') === 'true';
+  document.getElementById('hide-ln').checked = hide;
+  var items = document.querySelectorAll('[data-livenation="true"]');
+  items.forEach(function(item) {
+    item.style.display = hide ? 'none' : '';
+  });
+}
+
+document.addEventListener('DOMContentLoaded', applyLNFilter);
+</script>
+
+'''
+
 
 def generate_by_date_pages(concerts: List[Concert]) -> None:
     """Generate all by-date.X.html pages."""
     today = datetime.now()
 
-    # Group concerts by week number
-    by_week: Dict[int, List[Concert]] = defaultdict(list)
-
-    for concert in concerts:
-        week_num = get_week_number(concert.date, today)
+    # Bucket concerts by week number, then by day, in one pass over a single
+    # date sort so every day's list (and so every week) is already in date order
+    by_week: Dict[int, Dict[date, List[Concert]]] = defaultdict(lambda: defaultdict(list))
+    # Week number of each distinct day (it depends only on the day)
+    week_of_day: Dict[date, int] = {}
+
+    for concert in sorted(concerts, key=attrgetter("date")):
+        day = concert.date.date()
+        week_num = week_of_day.get(day)
+        if week_num is None:
+            week_num = week_of_day[day] = get_week_number(concert.date, today)
         if 0 <= week_num < WEEKS_AHEAD:
-            by_week[week_num].append(concert)
+            by_week[week_num][day].append(concert)
+
+    # Every page's heading and date shortcuts share one set of week labels and links
+    week_labels = _week_labels(today)
+    week_links = [f'<a href="by-date.{week_num}.html">{label}</a>' for week_num, label in enumerate(week_labels)]
 
     # Generate a page for each week
     for week_num in range(WEEKS_AHEAD):
-        week_concerts = by_week.get(week_num, [])
-        _generate_week_page(week_num, week_concerts, today)
+        date_shortcuts = _generate_date_shortcuts(week_num, week_labels, week_links)
+        _generate_week_page(week_num, by_week.get(week_num, {}), today, week_labels[week_num], date_shortcuts)
 
     logger.info(f"Generated {WEEKS_AHEAD} by-date pages")
 
 
-def _generate_date_shortcuts(current_week: int, reference_date: datetime) -> str:
-    """Generate date range shortcuts like foopee format.
-
-    Format: [ Jan 12 - Jan 18 | Jan 19 - Jan 25 | ... ]
-    Current week is shown in bold without a link.
-    Links wrap naturally across multiple lines.
+def _week_labels(reference_date: datetime) -> List[str]:
+    """Label of each by-date week, e.g. "Jan 12 - Jan 18".
 
     For the current week (week 0), the start date is adjusted to today
     to avoid showing past dates in the range.
     """
-    from ..config import WEEKS_AHEAD
-
-    today = reference_date  # reference_date is today when called from generate_by_date_pages
-    parts = []
+    labels = []
     for week_num in range(WEEKS_AHEAD):
-        week_start = reference_date + timedelta(weeks=week_num)
-        week_start, week_end = get_week_range(week_start)
-        # Format as "Jan 12 - Jan 18" with adjusted start for current week
-        label = get_adjusted_week_label(week_start, week_end, today)
+        week_start, week_end = get_week_range(reference_date + timedelta(weeks=week_num))
+        labels.append(get_adjusted_week_label(week_start, week_end, reference_date))
+    return labels
+
+
+def _generate_date_shortcuts(current_week: int, week_labels: List[str], week_links: List[str]) -> str:
+    """Generate date range shortcuts like foopee format.
 
-        if week_num == current_week:
-            # Current week - bold, no link
-            parts.append(f"<b>{label}</b>")
-        else:
-            parts.append(f'<a href="by-date.{week_num}.html">{label}</a>')
+    Format: [ Jan 12 - Jan 18 | Jan 19 - Jan 25 | ... ]
+    Current week is shown in bold without a link.
+    Links wrap naturally across multiple lines.
 
+    week_links holds each week's prebuilt link; only the current week differs.
+    """
+    parts = list(week_links)
+    parts[current_week] = f"<b>{week_labels[current_week]}</b>"
     return "[ " + " | ".join(parts) + " ]"
 
 
-def _generate_week_page(week_num: int, concerts: List[Concert], reference_date: datetime) -> None:
+def _parse_time_for_sort(time_str: str) -> int:
+    """Convert time string to minutes since midnight for sorting."""
+    if not time_str:
+        return 1200  # Default noon
+    match = SORT_TIME_RE.match(time_str.lower())
+    if not match:
+        return 1200
+    hour = int(match.group(1))
+    minute = int(match.group(2) or 0)
+    ampm = match.group(3)
+    if ampm == 'pm' and hour != 12:
+        hour += 12
+    elif ampm == 'am' and hour == 12:
+        hour = 0
+    return hour * 60 + minute
+
+
+def _generate_week_page(
+    week_num: int,
+    by_day: Dict[date, List[Concert]],
+    reference_date: datetime,
+    week_label: str,
+    date_shortcuts: str,
+) -> None:
     """Generate a single by-date.X.html page.
 
-    For the current week (week 0), the start date in the label is adjusted to today
-    to avoid showing past dates in the range.
+    by_day maps each day of the week to its concerts, in date order;
+    week_label and date_shortcuts come precomputed from generate_by_date_pages.
     """
     # Calculate week range
-    today = reference_date  # reference_date is today when called from generate_by_date_pages
-    week_start = reference_date + timedelta(weeks=week_num)
-    week_start, week_end = get_week_range(week_start)
-    week_label = get_adjusted_week_label(week_start, week_end, today)
+    week_start, _ = get_week_range(reference_date + timedelta(weeks=week_num))
 
-    # Group concerts by day
-    by_day: Dict[str, List[Concert]] = defaultdict(list)
-    for concert in sorted(concerts, key=lambda c: c.date):
-        day_key = concert.date.strftime("%Y-%m-%d")
-        by_day[day_key].append(concert)
+    # The week's concerts in date order
+    concerts = [concert for day_concerts in by_day.values() for concert in day_concerts]
+    # Format each day's key once for the schema
+    day_keys = {day: day.strftime("%Y-%m-%d") for day in by_day}
 
     # SEO description and structured data
     description = f"Boston concerts {week_label}. {len(concerts)} shows at local venues."
 
     # Build ItemList of MusicEvent schemas
     event_items = []
-    for i, concert in enumerate(sorted(concerts, key=lambda c: c.date)):
+    for i, concert in enumerate(concerts):
         event_item = {
             "@type": "ListItem",
             "position": i + 1,
             "item": {
                 "@type": "MusicEvent",
                 "name": f"{', '.join(concert.bands[:3])} at {concert.venue_name}" if concert.bands else concert.venue_name,
-                "startDate": concert.date.strftime("%Y-%m-%d"),
+                "startDate": day_keys[concert.date.date()],
                 "location": {
                     "@type": "MusicVenue",
                     "name": concert.venue_name,
@@ -119,52 +188,23 @@ def _generate_week_page(week_num: int, concerts: List[Concert], reference_date:
     } if concerts else None
 
     # Generate HTML
-    html = html_header(
+    parts = [html_header(
         title=f"Listing By Date - {week_label}",
         description=description,
         canonical_url=f"{SITE_URL}/by-date.{week_num}.html",
         structured_data=structured_data
-    )
-    html += f'''
-<p>[ <a href="list.html">Back</a> | <a href="mailto:sf@scottfriedman.ooo">Email Me</a> ]</p>
-
-<h2><i>Listing By Date</i></h2>
+    )]
+    parts.append(WEEK_PAGE_INTRO % week_label)
 
-<h3>{week_label}</h3>
-
-<p><label><input type="checkbox" id="hide-ln" onchange="toggleLN()"> Hide Ticketmaster Venues</label></p>
-
-<ul>
-'''
-
-    # Generate entries for each day
-    current_date = week_start
-    while current_date <= week_end:
-        day_key = current_date.strftime("%Y-%m-%d")
-        day_concerts = by_day.get(day_key, [])
+    # Generate entries for each day of the week (week_start is its Monday at midnight)
+    for day in [week_start + timedelta(days=i) for i in range(7)]:
+        day_concerts = by_day.get(day.date())
 
         if day_concerts:
-            day_label = current_date.strftime("%a %b %-d")
-            html += f'<li><b>{day_label}</b>\n<ul>\n'
+            day_label = day.strftime("%a %b %-d")
+            parts.append(f'<li><b>{day_label}</b>\n<ul>\n')
 
             # Sort by time, then venue name alphabetically
-            def _parse_time_for_sort(time_str: str) -> int:
-                """Convert time string to minutes since midnight for sorting."""
-                if not time_str:
-                    return 1200  # Default noon
-                import re
-                match = re.match(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', time_str.lower())
-                if not match:
-                    return 1200
-                hour = int(match.group(1))
-                minute = int(match.group(2) or 0)
-                ampm = match.group(3)
-                if ampm == 'pm' and hour != 12:
-                    hour += 12
-                elif ampm == 'am' and hour == 12:
-                    hour = 0
-                return hour * 60 + minute
-
             sorted_concerts = sorted(day_concerts, key=lambda c: (
                 (c.venue_name or "").lower(),
                 _parse_time_for_sort(c.time)
@@ -173,45 +213,14 @@ def _generate_week_page(week_num: int, concerts: List[Concert], reference_date:
                 line = format_concert_line(concert)
                 ln_attr = ' data-livenation="true"' if is_livenation_venue(concert) else ''
                 free_attr = ' data-free="true"' if is_free_event(concert) else ''
-                html += f'<li{ln_attr}{free_attr}>{line}</li>\n'
-
-            html += '</ul>\n</li>\n\n'
-
-        current_date += timedelta(days=1)
+                parts.append(f'<li{ln_attr}{free_attr}>{line}</li>\n')
 
-    # Generate date shortcuts
-    date_shortcuts = _generate_date_shortcuts(week_num, reference_date)
+            parts.append('</ul>\n</li>\n\n')
 
-    html += f'''</ul>
-
-<hr>
-<p>{date_shortcuts}</p>
-
-<p>[ <a href="list.html">Back</a> | <a href="mailto:sf@scottfriedman.ooo">Email Me</a> ]</p>
-
-<script>
-function toggleLN() {{
-  var hide = document.getElementById('hide-ln').checked;
-  sessionStorage.setItem('hideLN', hide ? 'true' : 'false');
-  applyLNFilter();
-}}
-
-function applyLNFilter() {{
-  var hide = sessionStorage.getItem('hideLN') === 'true';
-  document.getElementById('hide-ln').checked = hide;
-  var items = document.querySelectorAll('[data-livenation="true"]');
-  items.forEach(function(item) {{
-    item.style.display = hide ? 'none' : '';
-  }});
-}}
-
-document.addEventListener('DOMContentLoaded', applyLNFilter);
-</script>
-
-'''
-    html += html_footer()
+    parts.append(f'</ul>\n\n<hr>\n<p>{date_shortcuts}</p>\n\n')
+    parts.append(WEEK_PAGE_CLOSING)
+    parts.append(html_footer())
 
     # Write file
     output_path = Path(OUTPUT_DIR) / f"by-date.{week_num}.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    write_page(output_path, "".join(parts))
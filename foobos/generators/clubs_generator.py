@@ -2,12 +2,14 @@
 Generate clubs.html - venue directory page.
 """
 
-import json
+import functools
 import logging
 from pathlib import Path
+from typing import List
 
 from ..config import OUTPUT_DIR, DATA_DIR, SITE_URL
-from .helpers import html_header, html_footer
+from .helpers import html_header, html_footer, write_page
+from ..utils import read_json
 from ..utils.venue_registry import format_location
 
 logger = logging.getLogger(__name__)
@@ -19,9 +21,7 @@ def generate_clubs_page() -> None:
     venues_path = Path(DATA_DIR) / "venues.json"
 
     if venues_path.exists():
-        with open(venues_path) as f:
-            data = json.load(f)
-            venues = data.get("venues", [])
+        venues = _load_venues(venues_path, venues_path.stat().st_mtime)
     else:
         # Use default venue list if no data file
         venues = _get_default_venues()
@@ -64,13 +64,13 @@ def generate_clubs_page() -> None:
         "itemListElement": venue_items
     }
 
-    html = html_header(
+    parts = [html_header(
         title="foobos - Club Directory",
         description=description,
         canonical_url=f"{SITE_URL}/clubs.html",
         structured_data=structured_data
-    )
-    html += '''
+    )]
+    parts.append('''
 <h2><i>Club Directory</i></h2>
 
 <p><a href="list.html">Back to The List</a></p>
@@ -81,77 +81,81 @@ def generate_clubs_page() -> None:
 Live music venues across New England.
 </p>
 
-'''
-
-    for venue in venues:
-        venue_id = venue.get("id", "")
-        name = venue.get("name", "Unknown Venue")
-        location = venue.get("location", "")
-        state = venue.get("state", "MA")
-        address = venue.get("address", "")
-        phone = venue.get("phone", "")
-        website = venue.get("website", "")
-        capacity = venue.get("capacity", "")
-        notes = venue.get("notes", "")
-        status = venue.get("status", "")
-        closed_year = venue.get("closed_year", "")
-
-        # Format location with state for non-MA venues
-        display_location = format_location(venue_id)
-        if not display_location:
-            # Fallback: add state suffix for non-MA
-            if state and state != "MA" and location:
-                display_location = f"{location}, {state}"
-            else:
-                display_location = location
-
-        # Build venue name with closed indicator
-        display_name = name
-        if status == "closed":
-            if closed_year:
-                display_name = f"{name} (Closed {closed_year})"
-            else:
-                display_name = f"{name} (Closed)"
-
-        html += f'<p><a name="{venue_id}"><b>{display_name}</b></a>'
-        if display_location:
-            html += f", {display_location}"
-        html += "<br>\n"
-
-        if address:
-            html += f"&nbsp;&nbsp;&nbsp;{address}<br>\n"
-
-        details = []
-        if phone:
-            details.append(phone)
-        if capacity and status != "closed":
-            details.append(f"Capacity: {capacity}")
-
-        if details:
-            html += f"&nbsp;&nbsp;&nbsp;{' | '.join(details)}<br>\n"
-
-        if website and status != "closed":
-            html += f'&nbsp;&nbsp;&nbsp;<a href="{website}">{website}</a><br>\n'
-
-        if notes:
-            html += f"&nbsp;&nbsp;&nbsp;<i>{notes}</i><br>\n"
-
-        html += "</p>\n\n"
-
-    html += '''<hr>
+''')
+
+    parts.extend(_render_venue(venue) for venue in venues)
+
+    parts.append('''<hr>
 
 <p><a href="list.html">Back to The List</a></p>
 
-'''
-    html += html_footer()
+''')
+    parts.append(html_footer())
 
     output_path = Path(OUTPUT_DIR) / "clubs.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    write_page(output_path, "".join(parts))
 
     logger.info(f"Generated clubs.html with {len(venues)} venues")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_venues(venues_path: Path, mtime: float) -> List[dict]:
+    """Parse the venue list from venues.json (orjson when available).
+
+    The file's mtime is part of the cache key, so an edited file is re-read.
+    """
+    return read_json(venues_path).get("venues", [])
+
+
+def _render_venue(venue: dict) -> str:
+    """Render one venue's directory entry."""
+    venue_id = venue.get("id", "")
+    name = venue.get("name", "Unknown Venue")
+    location = venue.get("location", "")
+    state = venue.get("state", "MA")
+    address = venue.get("address", "")
+    phone = venue.get("phone", "")
+    website = venue.get("website", "")
+    capacity = venue.get("capacity", "")
+    notes = venue.get("notes", "")
+    status = venue.get("status", "")
+    closed_year = venue.get("closed_year", "")
+
+    # Format location with state for non-MA venues
+    display_location = format_location(venue_id)
+    if not display_location:
+        # Fallback: add state suffix for non-MA
+        if state and state != "MA" and location:
+            display_location = f"{location}, {state}"
+        else:
+            display_location = location
+
+    # Build venue name with closed indicator
+    display_name = name
+    if status == "closed":
+        if closed_year:
+            display_name = f"{name} (Closed {closed_year})"
+        else:
+            display_name = f"{name} (Closed)"
+
+    details = []
+    if phone:
+        details.append(phone)
+    if capacity and status != "closed":
+        details.append(f"Capacity: {capacity}")
+
+    return "".join((
+        f'<p><a name="{venue_id}"><b>{display_name}</b></a>',
+        f", {display_location}" if display_location else "",
+        "<br>\n",
+        f"&nbsp;&nbsp;&nbsp;{address}<br>\n" if address else "",
+        f"&nbsp;&nbsp;&nbsp;{' | '.join(details)}<br>\n" if details else "",
+        f'&nbsp;&nbsp;&nbsp;<a href="{website}">{website}</a><br>\n' if website and status != "closed" else "",
+        f"&nbsp;&nbsp;&nbsp;<i>{notes}</i><br>\n" if notes else "",
+        "</p>\n\n",
+    ))
+
+
 def _get_default_venues():
     """Return default venue list if no data file exists."""
     return [
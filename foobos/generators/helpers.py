@@ -2,13 +2,29 @@
 Helper functions for HTML generation.
 """
 
+import functools
 import json
+import os
+import re
 from html import escape
+from pathlib import Path
 from typing import Optional, Dict, Any
 
 from ..models import Concert
 from ..config import GA4_MEASUREMENT_ID, ANALYTICS_ENABLED, SITE_URL, DEFAULT_OG_IMAGE, SITE_NAME
 
+# Character substitutions applied to lowercased band names by _band_to_anchor
+ANCHOR_TABLE = str.maketrans({" ": "_", "'": None, ".": None, ",": None, "&": "and", "$": "s"})
+# Character substitutions applied to lowercased venue IDs by _venue_to_anchor
+VENUE_ANCHOR_TABLE = str.maketrans({" ": "_", "'": None, ".": None, ",": None})
+# Anything but (Unicode) letters, digits and underscores - same set as isalnum() or "_"
+ANCHOR_STRIP_RE = re.compile(r'\W+')
+
+# Event link - subtle arrow to source/ticket page, filled with the escaped URL.
+# Padding increases tap target for mobile (44px minimum recommended);
+# &nbsp; attaches arrow to previous text, preventing solo line wrap
+EVENT_LINK = '&nbsp;<a href="%s" title="Event info" style="text-decoration:none;padding:8px 12px;margin:-8px -4px">→</a>'
+
 # Live Nation / Ticketmaster operated venues (excludes Middle East which is independent)
 LIVE_NATION_VENUES = {
     'bignight', 'brighton', 'hob', 'mgm',
@@ -154,11 +170,28 @@ def html_footer() -> str:
 '''
 
 
+def write_page(output_path: Path, content: str) -> None:
+    """Write a generated file as UTF-8, replacing any previous copy atomically.
+
+    The content is encoded once and written to a temporary file beside the
+    target, which is then moved into place, so the site never serves a
+    half-written page.
+    """
+    data = content.encode("utf-8")
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
 def _venue_to_anchor(venue_id: str) -> str:
-    """Convert venue ID to HTML anchor (must match by_club_generator)."""
-    anchor = venue_id.lower()
-    anchor = anchor.replace(" ", "_").replace("'", "").replace(".", "").replace(",", "")
-    return anchor[:30]
+    """Convert venue ID to HTML anchor (shared by every page linking to by-club)."""
+    return venue_id.lower().translate(VENUE_ANCHOR_TABLE)[:30]
 
 
 def format_concert_line(concert: Concert, link_venue: bool = True, link_bands: bool = True) -> str:
@@ -210,21 +243,18 @@ def format_concert_line(concert: Concert, link_venue: bool = True, link_bands: b
     result = " ".join(parts)
 
     # Event link - subtle arrow to source/ticket page
-    # Padding increases tap target for mobile (44px minimum recommended)
-    # &nbsp; attaches arrow to previous text, preventing solo line wrap
     if concert.source_url:
-        result += f'&nbsp;<a href="{escape(concert.source_url)}" title="Event info" style="text-decoration:none;padding:8px 12px;margin:-8px -4px">→</a>'
+        result += EVENT_LINK % escape(concert.source_url)
 
     return result
 
 
+@functools.lru_cache(maxsize=None)
 def _band_to_anchor(band: str) -> str:
-    """Convert band name to HTML anchor."""
-    anchor = band.lower()
-    anchor = anchor.replace(" ", "_").replace("'", "").replace(".", "").replace(",", "")
-    anchor = anchor.replace("&", "and").replace("$", "s")
+    """Convert band name to HTML anchor (shared by every page linking to by-band)."""
+    anchor = band.lower().translate(ANCHOR_TABLE)
     # Remove other special characters except underscores
-    anchor = ''.join(c for c in anchor if c.isalnum() or c == '_')
+    anchor = ANCHOR_STRIP_RE.sub('', anchor)
     return anchor[:40]
 
 
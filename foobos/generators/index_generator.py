@@ -12,7 +12,7 @@ from pathlib import Path
 from ..models import Concert
 from ..config import OUTPUT_DIR, SITE_NAME, SITE_TITLE, SITE_DESCRIPTION, SITE_EMAIL, WEEKS_AHEAD, SITE_URL
 from ..utils.date_utils import get_week_range, get_week_label, get_adjusted_week_label
-from .helpers import html_header, html_footer
+from .helpers import html_header, html_footer, write_page
 
 logger = logging.getLogger(__name__)
 
@@ -223,8 +223,7 @@ document.addEventListener('DOMContentLoaded', applyLNFilter);
     html += html_footer()
 
     output_path = Path(OUTPUT_DIR) / "list.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    write_page(output_path, html)
 
     logger.info(f"Generated list.html")
 
@@ -7,7 +7,7 @@ import shutil
 from pathlib import Path
 
 from ..config import OUTPUT_DIR, PROJECT_ROOT, SITE_URL, SITE_NAME
-from .helpers import html_header, html_footer
+from .helpers import html_header, html_footer, write_page
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +48,7 @@ def generate_landing_page() -> None:
     html += html_footer()
 
     output_path = Path(OUTPUT_DIR) / "index.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    write_page(output_path, html)
 
     logger.info("Generated index.html (landing page)")
 
@@ -103,8 +102,7 @@ img {{
 '''
 
     fool_path = Path(OUTPUT_DIR) / "fool.html"
-    with open(fool_path, "w") as f:
-        f.write(fool_html)
+    write_page(fool_path, fool_html)
 
     logger.info("Generated fool.html")
 
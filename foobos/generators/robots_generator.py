@@ -6,6 +6,7 @@ import logging
 from pathlib import Path
 
 from ..config import OUTPUT_DIR, SITE_URL
+from .helpers import write_page
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,6 @@ Sitemap: {SITE_URL}/sitemap.xml
 """
 
     output_path = Path(OUTPUT_DIR) / "robots.txt"
-    with open(output_path, "w") as f:
-        f.write(content)
+    write_page(output_path, content)
 
     logger.info("Generated robots.txt")
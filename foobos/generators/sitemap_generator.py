@@ -7,6 +7,7 @@ import logging
 from pathlib import Path
 
 from ..config import OUTPUT_DIR, SITE_URL, WEEKS_AHEAD
+from .helpers import write_page
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +63,6 @@ def generate_sitemap() -> None:
 
     # Write file
     output_path = Path(OUTPUT_DIR) / "sitemap.xml"
-    with open(output_path, "w") as f:
-        f.write(xml)
+    write_page(output_path, xml)
 
     logger.info(f"Generated sitemap.xml with {len(static_pages) + WEEKS_AHEAD} URLs")
@@ -4,7 +4,8 @@ Concert data model.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from functools import cached_property
+from typing import List, Optional, Sequence
 import hashlib
 
 
@@ -23,17 +24,18 @@ class Concert:
     price_advance: Optional[int] = None
     price_door: Optional[int] = None
     time: str = "8pm"
-    flags: List[str] = field(default_factory=list)  # ["@", "$", "*"]
+    # Tag fields accept any sequence so scrapers can share immutable tuples
+    flags: Sequence[str] = field(default_factory=list)  # ["@", "$", "*"]
     source: str = ""  # "ticketmaster", "scrape:safe_in_a_crowd", etc.
     source_url: Optional[str] = None
-    genre_tags: List[str] = field(default_factory=list)
+    genre_tags: Sequence[str] = field(default_factory=list)
 
-    # Generated fields
-    id: str = field(default="", init=False)
+    # Generated fields (a stored id may be passed in when rehydrating)
+    id: str = ""
     last_updated: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
-        """Generate unique ID after initialization."""
+        """Generate unique ID after initialization, unless one was given."""
         if not self.id:
             self.id = self._generate_id()
 
@@ -98,6 +100,25 @@ class Concert:
             return f"${self.price_door}"
         return ""
 
+    @cached_property
+    def details_display(self) -> str:
+        """Return age, price and time for display (e.g., '18+ $25/$30 8pm').
+
+        Computed on first access and kept, so only read it once processing
+        has finished changing the concert.
+        """
+        parts = [self.age_requirement or "a/a"]
+        if self.price_display:
+            parts.append(self.price_display)
+        if self.time:
+            parts.append(self.time)
+        return " ".join(parts)
+
+    @cached_property
+    def flags_display(self) -> str:
+        """Return flags joined for display (e.g., '@ $'); kept like details_display."""
+        return " ".join(self.flags) if self.flags else ""
+
     @property
     def headliner(self) -> str:
         """Return the headlining band."""
@@ -153,9 +174,9 @@ class Concert:
             flags=data.get("flags", []),
             source=data.get("source", ""),
             source_url=data.get("source_url"),
-            genre_tags=data.get("genre_tags", [])
+            genre_tags=data.get("genre_tags", []),
+            id=data.get("id", "")
         )
-        concert.id = data.get("id", concert._generate_id())
         if "last_updated" in data:
             concert.last_updated = datetime.fromisoformat(data["last_updated"])
         return concert
@@ -346,10 +346,10 @@ def _merge_concerts(concerts: List[Concert]) -> Concert:
             best.price_door = concert.price_door
 
         # Merge flags
-        best.flags = list(set(best.flags + concert.flags))
+        best.flags = list(set(best.flags).union(concert.flags))
 
         # Merge genre tags
-        best.genre_tags = list(set(best.genre_tags + concert.genre_tags))
+        best.genre_tags = list(set(best.genre_tags).union(concert.genre_tags))
 
         # Use time if more specific
         if best.time == "8pm" and concert.time != "8pm":
@@ -4,6 +4,7 @@ Genre filtering for punk/hardcore/metal concerts.
 
 from typing import List
 import logging
+import re
 
 from rapidfuzz import fuzz
 
@@ -12,6 +13,44 @@ from ..config import PUNK_GENRES, EXCLUDE_GENRES, PRIORITY_BANDS
 
 logger = logging.getLogger(__name__)
 
+# Genre keyword lists as single alternations: one C-level scan per tag instead
+# of a Python loop of substring tests
+PUNK_GENRES_RE = re.compile("|".join(re.escape(g) for g in PUNK_GENRES))
+EXCLUDE_GENRES_RE = re.compile("|".join(re.escape(g) for g in EXCLUDE_GENRES))
+
+# Exact priority-band lookups, and lowercased names for the fuzzy fallback
+PRIORITY_BAND_SET = frozenset(PRIORITY_BANDS)
+PRIORITY_BANDS_LOWER = tuple(b.lower() for b in PRIORITY_BANDS)
+
+PUNK_BAND_KEYWORDS = [
+    "punk", "hardcore", "crust", "grind", "thrash", "doom",
+    "sludge", "death", "black", "metal", "noise", "power",
+    "violence", "chaos", "destroy", "dead", "hate", "war",
+    "blood", "death", "murder", "kill", "rot", "grave"
+]
+PUNK_BAND_KEYWORDS_RE = re.compile("|".join(re.escape(k) for k in PUNK_BAND_KEYWORDS))
+
+# Venues that primarily book punk/hardcore
+PUNK_VENUES = frozenset({
+    "middleeast",
+    "obriens",
+    "elks",
+    "vfw",
+    "legion",
+    "greatscott",
+    "midway",
+    "deepcuts",
+})
+
+# Venues that frequently book punk/hardcore
+PUNK_FRIENDLY_VENUES = frozenset({
+    "paradise",
+    "sinclair",
+    "brighton",
+    "royale",
+    "palladium",
+})
+
 
 def filter_by_genre(concerts: List[Concert], strict: bool = False) -> List[Concert]:
     """
@@ -51,15 +90,12 @@ def _is_relevant(concert: Concert, strict: bool = False) -> bool:
         tag_lower = tag.lower()
 
         # Check for punk-related genres
-        for punk_genre in PUNK_GENRES:
-            if punk_genre in tag_lower:
-                return True
+        if PUNK_GENRES_RE.search(tag_lower):
+            return True
 
         # Check for excluded genres (only if strict)
-        if strict:
-            for exclude_genre in EXCLUDE_GENRES:
-                if exclude_genre in tag_lower:
-                    return False
+        if strict and EXCLUDE_GENRES_RE.search(tag_lower):
+            return False
 
     # If not strict, use heuristics
     if not strict:
@@ -81,14 +117,15 @@ def _is_relevant(concert: Concert, strict: bool = False) -> bool:
 
 def _has_priority_band(concert: Concert) -> bool:
     """Check if any band is in the priority list."""
-    for band in concert.bands:
-        # Exact match
-        if band in PRIORITY_BANDS:
-            return True
+    # Exact match
+    if not PRIORITY_BAND_SET.isdisjoint(concert.bands):
+        return True
 
-        # Fuzzy match (handle slight variations)
-        for priority_band in PRIORITY_BANDS:
-            if fuzz.ratio(band.lower(), priority_band.lower()) > 90:
+    # Fuzzy match (handle slight variations)
+    for band in concert.bands:
+        band_lower = band.lower()
+        for priority_band in PRIORITY_BANDS_LOWER:
+            if fuzz.ratio(band_lower, priority_band) > 90:
                 return True
 
     return False
@@ -96,51 +133,18 @@ def _has_priority_band(concert: Concert) -> bool:
 
 def _has_punk_keywords_in_bands(concert: Concert) -> bool:
     """Check if band names contain punk-related keywords."""
-    punk_keywords = [
-        "punk", "hardcore", "crust", "grind", "thrash", "doom",
-        "sludge", "death", "black", "metal", "noise", "power",
-        "violence", "chaos", "destroy", "dead", "hate", "war",
-        "blood", "death", "murder", "kill", "rot", "grave"
-    ]
-
     combined_bands = " ".join(concert.bands).lower()
-
-    for keyword in punk_keywords:
-        if keyword in combined_bands:
-            return True
-
-    return False
+    return PUNK_BAND_KEYWORDS_RE.search(combined_bands) is not None
 
 
 def _is_punk_venue(venue_id: str) -> bool:
     """Check if venue is known for punk/hardcore shows."""
-    # Venues that primarily book punk/hardcore
-    punk_venues = [
-        "middleeast",
-        "obriens",
-        "elks",
-        "vfw",
-        "legion",
-        "greatscott",
-        "midway",
-        "deepcuts",
-    ]
-
-    # Venues that frequently book punk/hardcore
-    punk_friendly = [
-        "paradise",
-        "sinclair",
-        "brighton",
-        "royale",
-        "palladium",
-    ]
-
     venue_lower = venue_id.lower()
 
-    if venue_lower in punk_venues:
+    if venue_lower in PUNK_VENUES:
         return True
 
-    if venue_lower in punk_friendly:
+    if venue_lower in PUNK_FRIENDLY_VENUES:
         return True  # Include but might want less strict filtering
 
     return False
@@ -1,5 +1,8 @@
 from .date_utils import parse_date, format_date, get_week_range, get_week_number
-from .cache import get_cached, save_cache, clear_old_cache
+from .cache import (
+    get_cached, save_cache, delete_cache, get_cached_pickle, save_cache_pickle,
+    clear_old_cache, content_version, config_cache_key, read_json
+)
 from .venue_registry import (
     get_canonical_id, get_venue_info, format_location,
     get_all_venues, reload_venues
@@ -7,7 +10,8 @@ from .venue_registry import (
 
 __all__ = [
     "parse_date", "format_date", "get_week_range", "get_week_number",
-    "get_cached", "save_cache", "clear_old_cache",
+    "get_cached", "save_cache", "delete_cache", "get_cached_pickle", "save_cache_pickle",
+    "clear_old_cache", "content_version", "config_cache_key", "read_json",
     "get_canonical_id", "get_venue_info", "format_location",
     "get_all_venues", "reload_venues"
 ]
@@ -2,29 +2,89 @@
 Caching utilities for API responses and scraped data.
 """
 
+import hashlib
 import json
 import os
+import pickle
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Any
 
 from ..config import CACHE_DIR, CACHE_TTL_HOURS
 
+# orjson is optional - several times faster than json for cache reads/writes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def _get_cache_path(key: str) -> Path:
+
+# File suffixes of JSON and pickle cache entries
+CACHE_SUFFIXES = (".json", ".pkl")
+
+
+def _get_cache_path(key: str, suffix: str = ".json") -> Path:
     """Get the cache file path for a given key."""
     # Sanitize key for filesystem
     safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
-    return Path(CACHE_DIR) / f"{safe_key}.json"
+    return Path(CACHE_DIR) / f"{safe_key}{suffix}"
+
+
+def read_json(path: Path) -> Any:
+    """Load a JSON file, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as indented JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def _read_cached_at(path: Path) -> datetime:
+    """Return when a JSON or pickle cache entry was saved."""
+    if path.suffix == ".pkl":
+        with open(path, "rb") as f:
+            return pickle.load(f)["cached_at"]
+    return datetime.fromisoformat(read_json(path)["cached_at"])
+
+
+def content_version(content: str) -> str:
+    """Return a stable version tag (SHA-256 hex digest) for fetched content."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def config_cache_key(base: str, *config: Any) -> str:
+    """
+    Return a cache key that changes whenever the given config values change.
+
+    Scrapers fold the settings that shape their results (venue lists,
+    lookahead window, ...) into the key, so stale entries are never read
+    after a config change. The time TTL still applies on top.
+    """
+    digest = hashlib.blake2b(repr(config).encode("utf-8"), digest_size=8).hexdigest()
+    return f"{base}_{digest}"
 
 
-def get_cached(key: str, ttl_hours: Optional[int] = None) -> Optional[Any]:
+def get_cached(key: str, ttl_hours: Optional[int] = None,
+               version: Optional[str] = None) -> Optional[Any]:
     """
     Retrieve cached data if it exists and is not expired.
 
     Args:
         key: Cache key (e.g., "ticketmaster_boston", "scrape_middle_east")
         ttl_hours: Override default TTL in hours
+        version: If given, return the entry only when it was saved with the
+            same version, regardless of its age
 
     Returns:
         Cached data or None if expired/missing
@@ -35,8 +95,11 @@ def get_cached(key: str, ttl_hours: Optional[int] = None) -> Optional[Any]:
         return None
 
     try:
-        with open(cache_path, "r") as f:
-            cached = json.load(f)
+        cached = read_json(cache_path)
+
+        # Version-tagged lookups are valid for as long as the source is unchanged
+        if version is not None:
+            return cached["data"] if cached.get("version") == version else None
 
         # Check expiration
         cached_at = datetime.fromisoformat(cached["cached_at"])
@@ -50,13 +113,14 @@ def get_cached(key: str, ttl_hours: Optional[int] = None) -> Optional[Any]:
         return None
 
 
-def save_cache(key: str, data: Any) -> None:
+def save_cache(key: str, data: Any, version: Optional[str] = None) -> None:
     """
     Save data to cache.
 
     Args:
         key: Cache key
         data: Data to cache (must be JSON serializable)
+        version: Optional version tag of the source content (see content_version)
     """
     cache_path = _get_cache_path(key)
 
@@ -67,9 +131,80 @@ def save_cache(key: str, data: Any) -> None:
         "cached_at": datetime.now().isoformat(),
         "data": data
     }
+    if version is not None:
+        cache_entry["version"] = version
+
+    _write_json(cache_path, cache_entry)
+
+
+def delete_cache(key: str) -> bool:
+    """
+    Remove a single JSON cache entry, e.g. one known to be stale.
+
+    Returns:
+        True if an entry was removed
+    """
+    try:
+        _get_cache_path(key).unlink()
+        return True
+    except OSError:
+        return False
+
+
+def get_cached_pickle(key: str, ttl_hours: Optional[int] = None) -> Optional[Any]:
+    """
+    Retrieve pickled cached data if it exists and is not expired.
+
+    Pickle entries hold Python objects (e.g., Concert lists) as-is, so loading
+    them skips the from_dict() rebuild that JSON entries need. Only use this
+    for the local cache directory - never for data from elsewhere.
+
+    Args:
+        key: Cache key (e.g., "seatgeek_boston")
+        ttl_hours: Override default TTL in hours
+
+    Returns:
+        Cached data or None if expired/missing
+    """
+    cache_path = _get_cache_path(key, ".pkl")
+
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+
+        ttl = ttl_hours or CACHE_TTL_HOURS
+        if datetime.now() - cached["cached_at"] > timedelta(hours=ttl):
+            return None
+
+        return cached["data"]
+
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError):
+        return None
+
+
+def save_cache_pickle(key: str, data: Any) -> None:
+    """
+    Save data to cache with pickle, without converting it to JSON first.
+
+    Args:
+        key: Cache key
+        data: Data to cache (must be picklable)
+    """
+    cache_path = _get_cache_path(key, ".pkl")
+
+    # Ensure cache directory exists
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+    cache_entry = {
+        "cached_at": datetime.now(),
+        "data": data
+    }
 
-    with open(cache_path, "w") as f:
-        json.dump(cache_entry, f, indent=2)
+    with open(cache_path, "wb") as f:
+        pickle.dump(cache_entry, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def clear_old_cache(max_age_hours: int = 48) -> int:
@@ -86,15 +221,15 @@ def clear_old_cache(max_age_hours: int = 48) -> int:
     removed = 0
     cutoff = datetime.now() - timedelta(hours=max_age_hours)
 
-    for cache_file in cache_dir.glob("*.json"):
+    for cache_file in cache_dir.iterdir():
+        if cache_file.suffix not in CACHE_SUFFIXES:
+            continue
         try:
-            with open(cache_file) as f:
-                cached = json.load(f)
-            cached_at = datetime.fromisoformat(cached["cached_at"])
-            if cached_at < cutoff:
+            if _read_cached_at(cache_file) < cutoff:
                 cache_file.unlink()
                 removed += 1
-        except (json.JSONDecodeError, KeyError, ValueError, OSError):
+        except (json.JSONDecodeError, pickle.UnpicklingError, EOFError,
+                KeyError, TypeError, ValueError, OSError):
             # Remove corrupted cache files
             try:
                 cache_file.unlink()
@@ -117,7 +252,9 @@ def clear_cache() -> int:
         return 0
 
     removed = 0
-    for cache_file in cache_dir.glob("*.json"):
+    for cache_file in cache_dir.iterdir():
+        if cache_file.suffix not in CACHE_SUFFIXES:
+            continue
         try:
             cache_file.unlink()
             removed += 1
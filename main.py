@@ -8,6 +8,7 @@ CLI entry point for fetching, processing, and generating concert listings.
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -38,6 +39,7 @@ from foobos.fetchers.scrapers import (
     McCarthysToadScraper,
     SanctuaryMaynardScraper,
     HobgoblinScraper,
+    shutdown_browser,
 )
 from foobos.processors import normalize_concerts, deduplicate_concerts, filter_by_genre, filter_past_events
 from foobos.generators import generate_all_html
@@ -55,6 +57,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Scrapers that only use requests (no Playwright) and can safely run concurrently:
+# (progress label, source name, scraper class)
+STATIC_SCRAPERS = [
+    ("The Plough and Stars", "Plough and Stars", PloughAndStarsScraper),
+    ("Sally O'Brien's", "Sally O'Brien's", SallyOBriensScraper),
+    ("The Bebop", "The Bebop", TheBebopScraper),
+    ("Soundcheck Studios", "Soundcheck Studios", SoundcheckStudiosScraper),
+    ("The Beehive", "The Beehive", BeehiveScraper),
+    ("Club Passim", "Club Passim", ClubPassimScraper),
+    ("McCarthy's & Toad", "McCarthy's & Toad", McCarthysToadScraper),
+    ("Sanctuary Maynard", "Sanctuary Maynard", SanctuaryMaynardScraper),
+    ("Hobgoblin Bar", "Hobgoblin Bar", HobgoblinScraper),
+]
+STATIC_FETCH_WORKERS = 8
+
+
 def setup_directories():
     """Ensure required directories exist."""
     for dir_path in [OUTPUT_DIR, DATA_DIR, CACHE_DIR]:
@@ -140,6 +158,18 @@ def cmd_add(args):
     return 0
 
 
+def _fetch_source(label, name, scraper_cls):
+    """Run a single scraper, logging its result; failures yield an empty list."""
+    try:
+        logger.info(f"Scraping {label}...")
+        concerts = scraper_cls().fetch()
+        logger.info(f"{name}: {len(concerts)} concerts")
+        return concerts
+    except Exception as e:
+        logger.error(f"{name} scrape failed: {e}")
+        return []
+
+
 def cmd_fetch(args):
     """Fetch concert data from all sources."""
     logger.info("Starting fetch from all sources...")
@@ -245,45 +275,27 @@ def cmd_fetch(args):
     except Exception as e:
         logger.error(f"BSO venues scrape failed: {e}")
 
+    # Plain-HTTP scrapers spend nearly all their time waiting on the network,
+    # so start them all at once in background threads (Playwright scrapers
+    # still run one at a time on this thread). Results are added in the
+    # original source order.
+    static_pool = ThreadPoolExecutor(max_workers=STATIC_FETCH_WORKERS)
+    static_fetches = {
+        name: static_pool.submit(_fetch_source, label, name, scraper_cls)
+        for label, name, scraper_cls in STATIC_SCRAPERS
+    }
+
     # The Plough and Stars (Cambridge Irish pub)
-    try:
-        logger.info("Scraping The Plough and Stars...")
-        plough_scraper = PloughAndStarsScraper()
-        plough_concerts = plough_scraper.fetch()
-        logger.info(f"Plough and Stars: {len(plough_concerts)} concerts")
-        all_concerts.extend(plough_concerts)
-    except Exception as e:
-        logger.error(f"Plough and Stars scrape failed: {e}")
+    all_concerts.extend(static_fetches["Plough and Stars"].result())
 
     # Sally O'Brien's (Somerville bar with live music)
-    try:
-        logger.info("Scraping Sally O'Brien's...")
-        sally_scraper = SallyOBriensScraper()
-        sally_concerts = sally_scraper.fetch()
-        logger.info(f"Sally O'Brien's: {len(sally_concerts)} concerts")
-        all_concerts.extend(sally_concerts)
-    except Exception as e:
-        logger.error(f"Sally O'Brien's scrape failed: {e}")
+    all_concerts.extend(static_fetches["Sally O'Brien's"].result())
 
     # The Bebop (Boston South End jazz/soul venue)
-    try:
-        logger.info("Scraping The Bebop...")
-        bebop_scraper = TheBebopScraper()
-        bebop_concerts = bebop_scraper.fetch()
-        logger.info(f"The Bebop: {len(bebop_concerts)} concerts")
-        all_concerts.extend(bebop_concerts)
-    except Exception as e:
-        logger.error(f"The Bebop scrape failed: {e}")
+    all_concerts.extend(static_fetches["The Bebop"].result())
 
     # Soundcheck Studios (Pembroke - live music venue)
-    try:
-        logger.info("Scraping Soundcheck Studios...")
-        soundcheck_scraper = SoundcheckStudiosScraper()
-        soundcheck_concerts = soundcheck_scraper.fetch()
-        logger.info(f"Soundcheck Studios: {len(soundcheck_concerts)} concerts")
-        all_concerts.extend(soundcheck_concerts)
-    except Exception as e:
-        logger.error(f"Soundcheck Studios scrape failed: {e}")
+    all_concerts.extend(static_fetches["Soundcheck Studios"].result())
 
     # JazzBoston (Boston area jazz calendar aggregator)
     try:
@@ -345,55 +357,26 @@ def cmd_fetch(args):
     except Exception as e:
         logger.error(f"Sofar Sounds scrape failed: {e}")
 
+    # Last Playwright scraper: stop the shared browser so its driver no longer
+    # holds this thread's event loop (later sync or asyncio Playwright users)
+    shutdown_browser()
+
     # The Beehive (jazz club via Do617)
-    try:
-        logger.info("Scraping The Beehive...")
-        beehive_scraper = BeehiveScraper()
-        beehive_concerts = beehive_scraper.fetch()
-        logger.info(f"The Beehive: {len(beehive_concerts)} concerts")
-        all_concerts.extend(beehive_concerts)
-    except Exception as e:
-        logger.error(f"The Beehive scrape failed: {e}")
+    all_concerts.extend(static_fetches["The Beehive"].result())
 
     # Club Passim (folk venue in Cambridge)
-    try:
-        logger.info("Scraping Club Passim...")
-        passim_scraper = ClubPassimScraper()
-        passim_concerts = passim_scraper.fetch()
-        logger.info(f"Club Passim: {len(passim_concerts)} concerts")
-        all_concerts.extend(passim_concerts)
-    except Exception as e:
-        logger.error(f"Club Passim scrape failed: {e}")
+    all_concerts.extend(static_fetches["Club Passim"].result())
 
     # McCarthy's & Toad (Somerville venues)
-    try:
-        logger.info("Scraping McCarthy's & Toad...")
-        mccarthys_scraper = McCarthysToadScraper()
-        mccarthys_concerts = mccarthys_scraper.fetch()
-        logger.info(f"McCarthy's & Toad: {len(mccarthys_concerts)} concerts")
-        all_concerts.extend(mccarthys_concerts)
-    except Exception as e:
-        logger.error(f"McCarthy's & Toad scrape failed: {e}")
+    all_concerts.extend(static_fetches["McCarthy's & Toad"].result())
 
     # Sanctuary Maynard (Maynard concert venue)
-    try:
-        logger.info("Scraping Sanctuary Maynard...")
-        sanctuary_scraper = SanctuaryMaynardScraper()
-        sanctuary_concerts = sanctuary_scraper.fetch()
-        logger.info(f"Sanctuary Maynard: {len(sanctuary_concerts)} concerts")
-        all_concerts.extend(sanctuary_concerts)
-    except Exception as e:
-        logger.error(f"Sanctuary Maynard scrape failed: {e}")
+    all_concerts.extend(static_fetches["Sanctuary Maynard"].result())
 
     # Hobgoblin Bar (Brookline jazz bar)
-    try:
-        logger.info("Scraping Hobgoblin Bar...")
-        hobgoblin_scraper = HobgoblinScraper()
-        hobgoblin_concerts = hobgoblin_scraper.fetch()
-        logger.info(f"Hobgoblin Bar: {len(hobgoblin_concerts)} concerts")
-        all_concerts.extend(hobgoblin_concerts)
-    except Exception as e:
-        logger.error(f"Hobgoblin Bar scrape failed: {e}")
+    all_concerts.extend(static_fetches["Hobgoblin Bar"].result())
+
+    static_pool.shutdown()
 
     # Wally's Cafe Jazz Club (recurring events)
     try: